@@ -0,0 +1,31 @@
+"""Add max_concurrent_requests to MCP server configs
+
+Revision ID: 3f1c9a7b2d44
+Revises: add_performance_indexes
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1c9a7b2d44'
+down_revision: Union[str, None] = 'add_performance_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    op.add_column(
+        'mcp_server_configs',
+        sa.Column('max_concurrent_requests', sa.Integer(), server_default='8', nullable=False),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.drop_column('mcp_server_configs', 'max_concurrent_requests')
@@ -0,0 +1,20 @@
+"""Response classes for API routes."""
+
+from typing import Any
+
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+
+class PydanticCoreJSONResponse(ORJSONResponse):
+    """JSON response that serializes pydantic models in pydantic-core.
+
+    Return an instance from the route (``PydanticCoreJSONResponse(model)``) so
+    FastAPI skips response_model re-validation and the model is encoded once,
+    straight to bytes. Other content is encoded with orjson.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return content.__pydantic_serializer__.to_json(content)
+        return super().render(content)
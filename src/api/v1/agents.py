@@ -12,6 +12,7 @@ from src.api.dependencies import CurrentTenant, CurrentUser
 from src.db.models import Agent, Conversation, Message
 from src.db.session import get_db
 from src.schemas.agent import (
+    AGENT_LIST_ADAPTER,
     AgentCreate,
     AgentExecuteRequest,
     AgentExecuteResponse,
@@ -85,8 +86,9 @@ async def list_agents(
     result = await db.execute(query)
     agents = result.scalars().all()
 
-    return AgentListResponse(
-        data=[AgentResponse.model_validate(agent) for agent in agents],
+    # Items are already validated response models; skip re-validating the envelope
+    return AgentListResponse.model_construct(
+        data=AGENT_LIST_ADAPTER.validate_python(agents, from_attributes=True),
         pagination={
             "page": page,
             "limit": limit,
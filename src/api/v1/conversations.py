@@ -12,9 +12,9 @@ from src.api.dependencies import CurrentTenant, CurrentUser
 from src.db.models import Agent, Conversation, Message
 from src.db.session import get_db
 from src.schemas.conversation import (
+    MESSAGE_LIST_ADAPTER,
     ConversationListResponse,
     ConversationResponse,
-    MessageResponse,
 )
 
 router = APIRouter()
@@ -67,13 +67,13 @@ async def list_conversations(
                 title=conv.title,
                 status=conv.status,
                 context=conv.context,
-                metadata=conv.metadata,
+                extra_metadata=conv.extra_metadata,
                 started_at=conv.started_at,
                 completed_at=conv.completed_at,
             )
         )
 
-    return ConversationListResponse(
+    return ConversationListResponse.model_construct(
         data=data,
         pagination={
             "page": page,
@@ -115,9 +115,9 @@ async def get_conversation(
         user_id=conversation.user_id,
         title=conversation.title,
         status=conversation.status,
-        messages=[MessageResponse.model_validate(msg) for msg in messages_sorted],
+        messages=MESSAGE_LIST_ADAPTER.validate_python(messages_sorted, from_attributes=True),
         context=conversation.context,
-        metadata=conversation.metadata,
+        extra_metadata=conversation.extra_metadata,
         started_at=conversation.started_at,
         completed_at=conversation.completed_at,
     )
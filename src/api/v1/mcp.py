@@ -5,13 +5,16 @@ from typing import Annotated
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import func, select
+from sqlalchemy import func, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.dependencies import CurrentTenant, CurrentUser
+from src.api.pagination import decode_cursor, encode_cursor
 from src.db.models import MCPServer, MCPServerConfig, MCPToolExecution
 from src.db.session import get_db
 from src.schemas.mcp import (
+    MCP_SERVER_LIST_ADAPTER,
+    MCP_TOOL_EXECUTION_LIST_ADAPTER,
     MCPServerConfigCreate,
     MCPServerConfigResponse,
     MCPServerConfigUpdate,
@@ -74,6 +77,8 @@ async def list_mcp_servers(
     db: Annotated[AsyncSession, Depends(get_db)],
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(None),
+    include_total: bool = Query(False),
     status: str | None = Query(None),
     category: str | None = Query(None),
     search: str | None = Query(None),
@@ -91,22 +96,33 @@ async def list_mcp_servers(
     if search:
         query = query.where(MCPServer.name.ilike(f"%{search}%"))
 
-    # Count total
-    count_query = select(func.count()).select_from(query.subquery())
-    total = await db.scalar(count_query) or 0
-
-    # Get page of results
-    offset = (page - 1) * page_size
-    query = query.offset(offset).limit(page_size).order_by(MCPServer.created_at.desc())
+    # Counting scans every matching row, so only do it when asked
+    total = -1
+    if include_total:
+        count_query = select(func.count()).select_from(query.subquery())
+        total = await db.scalar(count_query) or 0
+
+    # Get page of results - seek past the cursor when given, otherwise fall back to
+    # page offsets; one extra row tells us whether another page exists
+    if cursor:
+        created_at, server_id = decode_cursor(cursor)
+        query = query.where(tuple_(MCPServer.created_at, MCPServer.id) < (created_at, server_id))
+    else:
+        query = query.offset((page - 1) * page_size)
+    query = query.limit(page_size + 1).order_by(MCPServer.created_at.desc(), MCPServer.id.desc())
     result = await db.execute(query)
     servers = result.scalars().all()
 
-    return MCPServerListResponse(
-        servers=[MCPServerResponse.model_validate(server) for server in servers],
+    has_more = len(servers) > page_size
+    servers = servers[:page_size]
+
+    return MCPServerListResponse.model_construct(
+        servers=MCP_SERVER_LIST_ADAPTER.validate_python(servers, from_attributes=True),
         total=total,
         page=page,
         page_size=page_size,
-        has_more=(offset + len(servers)) < total,
+        has_more=has_more,
+        next_cursor=encode_cursor(servers[-1].created_at, servers[-1].id) if has_more else None,
     )
 
 
@@ -298,7 +314,19 @@ async def execute_mcp_tool(
         )
         execution = execution_result.scalar_one()
 
-        return MCPToolExecuteResponse.model_validate(execution)
+        # Return the full output; the logged copy may be truncated
+        return MCPToolExecuteResponse(
+            execution_id=execution.id,
+            server_id=execution.server_id,
+            tool_name=execution.tool_name,
+            status=execution.status,
+            tool_output=result["output"],
+            error_message=execution.error_message,
+            error_code=execution.error_code,
+            execution_time_ms=execution.execution_time_ms,
+            started_at=execution.started_at,
+            completed_at=execution.completed_at,
+        )
 
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
@@ -316,6 +344,8 @@ async def list_mcp_tool_executions(
     status: str | None = Query(None),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(None),
+    include_total: bool = Query(False),
 ) -> MCPToolExecutionListResponse:
     """List MCP tool execution history."""
     # Build query
@@ -330,22 +360,37 @@ async def list_mcp_tool_executions(
     if status:
         query = query.where(MCPToolExecution.status == status)
 
-    # Count total
-    count_query = select(func.count()).select_from(query.subquery())
-    total = await db.scalar(count_query) or 0
+    total = -1
+    if include_total:
+        count_query = select(func.count()).select_from(query.subquery())
+        total = await db.scalar(count_query) or 0
 
     # Get page of results
-    offset = (page - 1) * page_size
-    query = query.offset(offset).limit(page_size).order_by(MCPToolExecution.started_at.desc())
+    if cursor:
+        started_at, execution_id = decode_cursor(cursor)
+        query = query.where(
+            tuple_(MCPToolExecution.started_at, MCPToolExecution.id) < (started_at, execution_id)
+        )
+    else:
+        query = query.offset((page - 1) * page_size)
+    query = query.limit(page_size + 1).order_by(
+        MCPToolExecution.started_at.desc(), MCPToolExecution.id.desc()
+    )
     result = await db.execute(query)
     executions = result.scalars().all()
 
-    return MCPToolExecutionListResponse(
-        executions=[MCPToolExecutionResponse.model_validate(execution) for execution in executions],
+    has_more = len(executions) > page_size
+    executions = executions[:page_size]
+
+    return MCPToolExecutionListResponse.model_construct(
+        executions=MCP_TOOL_EXECUTION_LIST_ADAPTER.validate_python(executions, from_attributes=True),
         total=total,
         page=page,
         page_size=page_size,
-        has_more=(offset + len(executions)) < total,
+        has_more=has_more,
+        next_cursor=(
+            encode_cursor(executions[-1].started_at, executions[-1].id) if has_more else None
+        ),
     )
 
 
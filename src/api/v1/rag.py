@@ -6,7 +6,8 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.api.dependencies import CurrentTenant, CurrentUser
+from src.api.dependencies import CurrentTenant, CurrentUser, json_body, json_body_schema
+from src.api.responses import PydanticCoreJSONResponse
 from src.db.models import Tenant, User
 from src.db.session import get_db
 from src.schemas.rag import (
@@ -51,7 +52,7 @@ async def create_collection(
     await db.commit()
     await db.refresh(new_collection)
 
-    return CollectionResponse.model_validate(new_collection)
+    return CollectionResponse.from_orm_fast(new_collection)
 
 
 @router.get("/collections", response_model=CollectionListResponse)
@@ -60,14 +61,15 @@ async def list_collections(
     db: Annotated[AsyncSession, Depends(get_db)],
     skip: int = 0,
     limit: int = 20,
-) -> CollectionListResponse:
+) -> PydanticCoreJSONResponse:
     """List all collections for the tenant."""
     rag_service = RAGService(db, tenant.id)
 
     collections, total = await rag_service.list_collections(skip=skip, limit=limit)
 
-    return CollectionListResponse(
-        data=[CollectionResponse.model_validate(c) for c in collections],
+    # Returned as a response, bypassing response_model re-validation
+    envelope = CollectionListResponse.model_construct(
+        data=[CollectionResponse.from_orm_fast(collection) for collection in collections],
         pagination={
             "skip": skip,
             "limit": limit,
@@ -75,6 +77,7 @@ async def list_collections(
             "has_more": skip + len(collections) < total,
         },
     )
+    return PydanticCoreJSONResponse(envelope)
 
 
 @router.get("/collections/{collection_id}", response_model=CollectionResponse)
@@ -93,7 +96,7 @@ async def get_collection(
             detail="Collection not found",
         )
 
-    return CollectionResponse.model_validate(collection)
+    return CollectionResponse.from_orm_fast(collection)
 
 
 @router.delete("/collections/{collection_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -155,7 +158,7 @@ async def upload_document(
         await db.commit()
         await db.refresh(document)
 
-        return DocumentResponse.model_validate(document)
+        return DocumentResponse.from_orm_fast(document)
 
     except Exception as e:
         await db.rollback()
@@ -172,7 +175,7 @@ async def list_documents(
     db: Annotated[AsyncSession, Depends(get_db)],
     skip: int = 0,
     limit: int = 20,
-) -> DocumentListResponse:
+) -> PydanticCoreJSONResponse:
     """List all documents in a collection."""
     rag_service = RAGService(db, tenant.id)
 
@@ -190,8 +193,8 @@ async def list_documents(
         limit=limit,
     )
 
-    return DocumentListResponse(
-        data=[DocumentResponse.model_validate(d) for d in documents],
+    envelope = DocumentListResponse.model_construct(
+        data=[DocumentResponse.from_orm_fast(document) for document in documents],
         pagination={
             "skip": skip,
             "limit": limit,
@@ -199,11 +202,14 @@ async def list_documents(
             "has_more": skip + len(documents) < total,
         },
     )
+    return PydanticCoreJSONResponse(envelope)
 
 
-@router.post("/query", response_model=RAGQueryResponse)
+@router.post(
+    "/query", response_model=RAGQueryResponse, openapi_extra=json_body_schema(RAGQueryRequest)
+)
 async def query_knowledge_base(
-    query_request: RAGQueryRequest,
+    query_request: Annotated[RAGQueryRequest, json_body(RAGQueryRequest)],
     tenant: CurrentTenant,
     db: Annotated[AsyncSession, Depends(get_db)],
 ) -> RAGQueryResponse:
@@ -230,25 +236,13 @@ async def query_knowledge_base(
 
     await db.commit()
 
-    # Build response
+    # Build response - only the top-k hits, copied straight from the rows
     from src.schemas.rag import ChunkResponse
 
-    chunk_responses = []
-    for chunk in chunks:
-        chunk_response = ChunkResponse(
-            id=chunk.id,
-            document_id=chunk.document_id,
-            collection_id=chunk.collection_id,
-            content=chunk.content if query_request.include_content else "",
-            sequence_number=chunk.sequence_number,
-            token_count=chunk.token_count,
-            page_number=chunk.page_number,
-            section=chunk.section,
-            score=getattr(chunk, "score", None),
-            extra_metadata=chunk.extra_metadata,
-            created_at=chunk.created_at,
-        )
-        chunk_responses.append(chunk_response)
+    if query_request.include_content:
+        chunk_responses = [ChunkResponse.from_orm_fast(chunk) for chunk in chunks]
+    else:
+        chunk_responses = [ChunkResponse.from_orm_fast(chunk, content="") for chunk in chunks]
 
     return RAGQueryResponse(
         query=query_request.query,
@@ -291,22 +285,7 @@ async def get_context_for_agent(
     # Build response
     from src.schemas.rag import ChunkResponse
 
-    chunk_responses = []
-    for chunk in chunks:
-        chunk_response = ChunkResponse(
-            id=chunk.id,
-            document_id=chunk.document_id,
-            collection_id=chunk.collection_id,
-            content=chunk.content,
-            sequence_number=chunk.sequence_number,
-            token_count=chunk.token_count,
-            page_number=chunk.page_number,
-            section=chunk.section,
-            score=getattr(chunk, "score", None),
-            extra_metadata=chunk.extra_metadata,
-            created_at=chunk.created_at,
-        )
-        chunk_responses.append(chunk_response)
+    chunk_responses = [ChunkResponse.from_orm_fast(chunk) for chunk in chunks]
 
     return RAGContextResponse(
         context=context,
@@ -18,7 +18,14 @@ from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from src.api.dependencies import CurrentTenant, CurrentUser, get_db
+from src.api.dependencies import (
+    CurrentTenant,
+    CurrentUser,
+    get_db,
+    json_body,
+    json_body_schema,
+)
+from src.api.responses import PydanticCoreJSONResponse
 from src.db.models import (
     AgentMessage,
     AgentTask,
@@ -27,6 +34,8 @@ from src.db.models import (
     WorkflowStepExecution,
 )
 from src.schemas.workflow import (
+    STEP_LIST_ADAPTER,
+    TRIGGER_LIST_ADAPTER,
     AgentMessageCreate,
     AgentMessageListResponse,
     AgentMessageResponse,
@@ -81,9 +90,9 @@ async def create_workflow(
         )
 
     # Convert step definitions to dict
-    steps = [step.model_dump() for step in workflow_data.steps]
+    steps = STEP_LIST_ADAPTER.dump_python(workflow_data.steps)
     triggers = (
-        [trigger.model_dump() for trigger in workflow_data.triggers]
+        TRIGGER_LIST_ADAPTER.dump_python(workflow_data.triggers)
         if workflow_data.triggers
         else None
     )
@@ -110,7 +119,7 @@ async def create_workflow(
     await db.commit()
     await db.refresh(workflow)
 
-    return workflow
+    return WorkflowResponse.from_orm_fast(workflow)
 
 
 @router.get("/workflows", response_model=WorkflowListResponse)
@@ -143,12 +152,15 @@ async def list_workflows(
     result = await db.execute(query)
     workflows = result.scalars().all()
 
-    return WorkflowListResponse(
-        workflows=workflows,
+    # Returned as a response so FastAPI doesn't re-validate and re-encode every row
+    # through response_model
+    envelope = WorkflowListResponse.model_construct(
+        workflows=[WorkflowResponse.from_orm_fast(workflow) for workflow in workflows],
         total=total or 0,
         offset=offset,
         limit=limit,
     )
+    return PydanticCoreJSONResponse(envelope)
 
 
 @router.get("/workflows/{workflow_id}", response_model=WorkflowResponse)
@@ -173,7 +185,7 @@ async def get_workflow(
             detail=f"Workflow {workflow_id} not found",
         )
 
-    return workflow
+    return WorkflowResponse.from_orm_fast(workflow)
 
 
 @router.patch("/workflows/{workflow_id}", response_model=WorkflowResponse)
@@ -200,7 +212,7 @@ async def update_workflow(
             detail=f"Workflow {workflow_id} not found",
         )
 
-    # Update fields
+    # Update fields - nested step and trigger models are dumped to plain dicts here too
     update_data = workflow_data.model_dump(exclude_unset=True)
 
     # Handle name change (regenerate slug)
@@ -222,14 +234,6 @@ async def update_workflow(
             )
         workflow.slug = new_slug
 
-    # Convert step definitions if provided
-    if "steps" in update_data and update_data["steps"]:
-        update_data["steps"] = [step.model_dump() for step in workflow_data.steps]
-
-    # Convert trigger definitions if provided
-    if "triggers" in update_data and update_data["triggers"]:
-        update_data["triggers"] = [trigger.model_dump() for trigger in workflow_data.triggers]
-
     # Apply updates
     for field, value in update_data.items():
         setattr(workflow, field, value)
@@ -237,7 +241,7 @@ async def update_workflow(
     await db.commit()
     await db.refresh(workflow)
 
-    return workflow
+    return WorkflowResponse.from_orm_fast(workflow)
 
 
 @router.delete("/workflows/{workflow_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -293,7 +297,7 @@ async def activate_workflow(
     await db.commit()
     await db.refresh(workflow)
 
-    return workflow
+    return WorkflowResponse.from_orm_fast(workflow)
 
 
 # ============================================================================
@@ -301,9 +305,13 @@ async def activate_workflow(
 # ============================================================================
 
 
-@router.post("/workflows/execute", response_model=WorkflowExecutionResponse)
+@router.post(
+    "/workflows/execute",
+    response_model=WorkflowExecutionResponse,
+    openapi_extra=json_body_schema(WorkflowExecuteRequest),
+)
 async def execute_workflow(
-    execute_data: WorkflowExecuteRequest,
+    execute_data: Annotated[WorkflowExecuteRequest, json_body(WorkflowExecuteRequest)],
     tenant: CurrentTenant,
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
@@ -318,7 +326,7 @@ async def execute_workflow(
             input_data=execute_data.input_data,
             context=execute_data.context,
         )
-        return execution
+        return WorkflowExecutionResponse.from_orm_fast(execution)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -360,12 +368,15 @@ async def list_workflow_executions(
     result = await db.execute(query)
     executions = result.scalars().all()
 
-    return WorkflowExecutionListResponse(
-        executions=executions,
+    envelope = WorkflowExecutionListResponse.model_construct(
+        executions=[
+            WorkflowExecutionResponse.from_orm_fast(execution) for execution in executions
+        ],
         total=total or 0,
         offset=offset,
         limit=limit,
     )
+    return PydanticCoreJSONResponse(envelope)
 
 
 @router.get("/workflows/executions/{execution_id}", response_model=WorkflowExecutionDetailResponse)
@@ -392,26 +403,17 @@ async def get_workflow_execution(
             detail=f"Workflow execution {execution_id} not found",
         )
 
-    # Convert to response model
-    return WorkflowExecutionDetailResponse(
-        id=execution.id,
-        tenant_id=execution.tenant_id,
-        workflow_id=execution.workflow_id,
-        status=execution.status,
-        current_step=execution.current_step,
-        input_data=execution.input_data,
-        output_data=execution.output_data,
-        context=execution.context,
-        error_message=execution.error_message,
-        duration_seconds=execution.duration_seconds,
-        started_at=execution.started_at,
-        completed_at=execution.completed_at,
-        created_at=execution.created_at,
+    # Convert to response model - parent and steps are built flat from the rows, and
+    # the nested result is returned directly so response_model doesn't re-validate
+    # every step
+    envelope = WorkflowExecutionDetailResponse.from_orm_fast(
+        execution,
         steps=[
-            WorkflowStepExecutionResponse.model_validate(step)
+            WorkflowStepExecutionResponse.from_orm_fast(step)
             for step in execution.step_executions
         ],
     )
+    return PydanticCoreJSONResponse(envelope)
 
 
 @router.post("/workflows/executions/{execution_id}/cancel", response_model=WorkflowExecutionResponse)
@@ -425,7 +427,7 @@ async def cancel_workflow_execution(
 
     try:
         execution = await engine.cancel_workflow(execution_id)
-        return execution
+        return WorkflowExecutionResponse.from_orm_fast(execution)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -457,9 +459,14 @@ async def get_execution_status(
 # ============================================================================
 
 
-@router.post("/tasks", response_model=AgentTaskResponse, status_code=status.HTTP_201_CREATED)
+@router.post(
+    "/tasks",
+    response_model=AgentTaskResponse,
+    status_code=status.HTTP_201_CREATED,
+    openapi_extra=json_body_schema(AgentTaskCreate),
+)
 async def create_agent_task(
-    task_data: AgentTaskCreate,
+    task_data: Annotated[AgentTaskCreate, json_body(AgentTaskCreate)],
     tenant: CurrentTenant,
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
@@ -482,7 +489,7 @@ async def create_agent_task(
     await db.commit()
     await db.refresh(task)
 
-    return task
+    return AgentTaskResponse.from_orm_fast(task)
 
 
 @router.get("/tasks", response_model=AgentTaskListResponse)
@@ -515,12 +522,13 @@ async def list_agent_tasks(
     result = await db.execute(query)
     tasks = result.scalars().all()
 
-    return AgentTaskListResponse(
-        tasks=tasks,
+    envelope = AgentTaskListResponse.model_construct(
+        tasks=[AgentTaskResponse.from_orm_fast(task) for task in tasks],
         total=total or 0,
         offset=offset,
         limit=limit,
     )
+    return PydanticCoreJSONResponse(envelope)
 
 
 @router.get("/tasks/{task_id}", response_model=AgentTaskResponse)
@@ -544,7 +552,7 @@ async def get_agent_task(
             detail=f"Task {task_id} not found",
         )
 
-    return task
+    return AgentTaskResponse.from_orm_fast(task)
 
 
 @router.patch("/tasks/{task_id}", response_model=AgentTaskResponse)
@@ -585,7 +593,7 @@ async def update_agent_task(
     await db.commit()
     await db.refresh(task)
 
-    return task
+    return AgentTaskResponse.from_orm_fast(task)
 
 
 # ============================================================================
@@ -593,9 +601,14 @@ async def update_agent_task(
 # ============================================================================
 
 
-@router.post("/messages", response_model=AgentMessageResponse, status_code=status.HTTP_201_CREATED)
+@router.post(
+    "/messages",
+    response_model=AgentMessageResponse,
+    status_code=status.HTTP_201_CREATED,
+    openapi_extra=json_body_schema(AgentMessageCreate),
+)
 async def create_agent_message(
-    message_data: AgentMessageCreate,
+    message_data: Annotated[AgentMessageCreate, json_body(AgentMessageCreate)],
     tenant: CurrentTenant,
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
@@ -618,7 +631,7 @@ async def create_agent_message(
     await db.commit()
     await db.refresh(message)
 
-    return message
+    return AgentMessageResponse.from_orm_fast(message)
 
 
 @router.get("/messages", response_model=AgentMessageListResponse)
@@ -651,12 +664,13 @@ async def list_agent_messages(
     result = await db.execute(query)
     messages = result.scalars().all()
 
-    return AgentMessageListResponse(
-        messages=messages,
+    envelope = AgentMessageListResponse.model_construct(
+        messages=[AgentMessageResponse.from_orm_fast(message) for message in messages],
         total=total or 0,
         offset=offset,
         limit=limit,
     )
+    return PydanticCoreJSONResponse(envelope)
 
 
 @router.get("/messages/{message_id}", response_model=AgentMessageResponse)
@@ -680,7 +694,7 @@ async def get_agent_message(
             detail=f"Message {message_id} not found",
         )
 
-    return message
+    return AgentMessageResponse.from_orm_fast(message)
 
 
 @router.patch("/messages/{message_id}", response_model=AgentMessageResponse)
@@ -721,4 +735,4 @@ async def update_agent_message(
     await db.commit()
     await db.refresh(message)
 
-    return message
+    return AgentMessageResponse.from_orm_fast(message)
@@ -12,8 +12,9 @@ from src.core.metrics import cache_hits_total, cache_misses_total
 
 logger = get_logger(__name__)
 
-# Redis client instance
+# Redis client instances
 _redis_client: Optional[Redis] = None
+_binary_redis_client: Optional[Redis] = None
 
 
 async def get_redis() -> Redis:
@@ -35,14 +36,36 @@ async def get_redis() -> Redis:
     return _redis_client
 
 
+async def get_binary_redis() -> Redis:
+    """Get a Redis client that returns raw bytes, for binary cache values.
+
+    Returns:
+        Redis client with response decoding disabled
+    """
+    global _binary_redis_client
+
+    if _binary_redis_client is None:
+        _binary_redis_client = redis.from_url(
+            str(settings.REDIS_URL),
+            decode_responses=False,
+            max_connections=settings.REDIS_POOL_SIZE,
+        )
+
+    return _binary_redis_client
+
+
 async def close_redis() -> None:
-    """Close Redis connection."""
-    global _redis_client
+    """Close Redis connections."""
+    global _redis_client, _binary_redis_client
 
     if _redis_client:
         await _redis_client.close()
         _redis_client = None
 
+    if _binary_redis_client:
+        await _binary_redis_client.close()
+        _binary_redis_client = None
+
 
 class CacheService:
     """Redis cache service for application data."""
@@ -46,6 +46,16 @@ class Settings(BaseSettings):
     DEFAULT_AGENT_TIMEOUT: int = 300  # 5 minutes
     MAX_AGENT_ITERATIONS: int = 10
 
+    # RAG
+    RAG_QUERY_CACHE_SIZE: int = 1024  # 0 disables the semantic query cache
+    RAG_QUERY_CACHE_TTL: int = 300  # 5 minutes
+    RAG_QUERY_CACHE_MIN_SIMILARITY: float = 0.95
+    OPENAI_EMBED_CONCURRENCY: int = 8  # Embedding requests in flight per batch call
+    OPENAI_MAX_RETRIES: int = 5  # Retries with backoff on rate limits and 5xx errors
+
+    # MCP
+    MCP_TOOL_OUTPUT_LOG_MAX_BYTES: int = 256 * 1024  # Larger outputs are logged as a preview
+
     # Logging
     LOG_LEVEL: str = "INFO"
     ENVIRONMENT: str = "development"  # development, staging, production
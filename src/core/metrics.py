@@ -1,5 +1,7 @@
 """Prometheus metrics for application observability."""
 
+import time
+
 from prometheus_client import Counter, Gauge, Histogram, Info
 from prometheus_client import generate_latest, CONTENT_TYPE_LATEST
 
@@ -108,6 +110,12 @@ mcp_tool_call_duration_seconds = Histogram(
     buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0),
 )
 
+mcp_request_queue_waits_total = Counter(
+    "mcp_request_queue_waits_total",
+    "MCP requests that waited for a free concurrency slot on their server process",
+    ["server_id"],
+)
+
 # RAG metrics
 rag_document_processing_total = Counter(
     "rag_document_processing_total",
@@ -166,13 +174,30 @@ active_tenants = Gauge(
 )
 
 
+# Rendered exposition output is reused for this many seconds, so bursts of
+# scrapes don't each re-serialize every metric
+METRICS_CACHE_TTL_SECONDS = 1.0
+
+_metrics_cache: tuple[float, bytes] | None = None
+
+
 def get_metrics() -> bytes:
     """Get current metrics in Prometheus format.
 
+    Output is cached for METRICS_CACHE_TTL_SECONDS.
+
     Returns:
         Metrics data in Prometheus exposition format
     """
-    return generate_latest()
+    global _metrics_cache
+
+    now = time.monotonic()
+    if _metrics_cache is not None and now - _metrics_cache[0] < METRICS_CACHE_TTL_SECONDS:
+        return _metrics_cache[1]
+
+    data = generate_latest()
+    _metrics_cache = (now, data)
+    return data
 
 
 def get_metrics_content_type() -> str:
@@ -670,6 +670,9 @@ class MCPServerConfig(Base, UUIDMixin, TimestampMixin):
     # Resource limits
     timeout_seconds: Mapped[int] = mapped_column(Integer, default=30)
     max_retries: Mapped[int] = mapped_column(Integer, default=3)
+    max_concurrent_requests: Mapped[int] = mapped_column(
+        Integer, default=8, server_default="8"
+    )  # In-flight requests per server process
     rate_limit_per_minute: Mapped[int | None] = mapped_column(Integer, nullable=True)
 
     # JSONB metadata
@@ -1,10 +1,13 @@
 """Main FastAPI application."""
 
+import asyncio
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
+import orjson
 from fastapi import Depends, FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -24,6 +27,22 @@ configure_logging()
 configure_sentry()
 logger = get_logger(__name__)
 
+# Static probe bodies, serialized once at import. A fresh Response is still built per
+# request because middleware mutates response headers in place.
+_HEALTHY_BODY = orjson.dumps({"status": "healthy"})
+_ALIVE_BODY = orjson.dumps({"status": "alive"})
+
+
+# How often connection pool gauges are refreshed
+POOL_METRICS_INTERVAL_SECONDS = 5
+
+
+async def _pool_metrics_loop() -> None:
+    """Refresh connection pool metrics until cancelled."""
+    while True:
+        await asyncio.sleep(POOL_METRICS_INTERVAL_SECONDS)
+        await update_pool_metrics()
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
@@ -36,14 +55,21 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         environment=settings.ENVIRONMENT,
     )
 
-    # Update pool metrics on startup
+    # Update pool metrics on startup, then keep them fresh in the background
     await update_pool_metrics()
+    pool_metrics_task = asyncio.create_task(_pool_metrics_loop())
 
     yield
 
     # Shutdown
     logger.info("application_shutdown")
 
+    pool_metrics_task.cancel()
+    try:
+        await pool_metrics_task
+    except asyncio.CancelledError:
+        pass
+
     # Close connections
     await close_redis()
     await engine.dispose()
@@ -59,19 +85,19 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    default_response_class=ORJSONResponse,
 )
 
 # Configure tracing
 configure_tracing(app)
 
-# CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.ALLOWED_ORIGINS,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# Middleware runs in reverse order of registration: the last one added is outermost.
+# Request flow: CORS -> rate limiting -> correlation ID -> request logging, so
+# rate-limited requests are rejected before any logging work is done.
+
+# Observability middleware
+app.add_middleware(RequestLoggingMiddleware)
+app.add_middleware(CorrelationIdMiddleware)
 
 # Rate limiting middleware
 app.add_middleware(
@@ -81,18 +107,23 @@ app.add_middleware(
     enabled=True,
 )
 
-# Observability middleware
-app.add_middleware(RequestLoggingMiddleware)
-app.add_middleware(CorrelationIdMiddleware)
+# CORS middleware - outermost so preflight requests and rejections still get CORS headers
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=settings.ALLOWED_ORIGINS,
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
 
 # Include API router
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
 
 @app.get("/health")
-async def health_check() -> dict[str, str]:
+async def health_check() -> Response:
     """Basic health check endpoint."""
-    return {"status": "healthy"}
+    return Response(content=_HEALTHY_BODY, media_type="application/json")
 
 
 @app.get("/health/ready")
@@ -114,9 +145,9 @@ async def readiness_check(db: AsyncSession = Depends(get_db)) -> dict[str, str |
 
 
 @app.get("/health/live")
-async def liveness_check() -> dict[str, str]:
+async def liveness_check() -> Response:
     """Liveness probe."""
-    return {"status": "alive"}
+    return Response(content=_ALIVE_BODY, media_type="application/json")
 
 
 @app.get("/metrics")
@@ -3,12 +3,36 @@
 import asyncio
 import json
 import logging
+import os
 import sys
 from abc import ABC, abstractmethod
 from typing import Any
 
+import orjson
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - uvloop is optional (ships with uvicorn[standard])
+    uvloop = None
+
 logger = logging.getLogger(__name__)
 
+# Bytes requested from stdin per read - one pipe buffer's worth, so several
+# pipelined requests are picked up by a single syscall
+_READ_CHUNK_SIZE = 65536
+
+_FRAMINGS = ("newline", "content-length")
+
+
+def prewrapped(func):
+    """Mark a handle_tool_call implementation as returning the full tools/call result.
+
+    Marked handlers build the {"content": ...} envelope themselves, so
+    handle_tools_call passes their result through instead of wrapping it again.
+    """
+    func._prewrapped = True
+    return func
+
 
 class BaseMCPServer(ABC):
     """Base class for MCP servers implementing the JSON-RPC protocol.
@@ -18,13 +42,33 @@ class BaseMCPServer(ABC):
     2. Implement get_tools() to return tool definitions
     3. Implement handle_tool_call() to execute tools
     4. Optionally implement get_resources() for resource support
+
+    Messages are framed either one JSON object per line ("newline", the
+    default) or with an LSP-style "Content-Length: N" header block followed
+    by a blank line ("content-length").
+
+    Requests are dispatched concurrently (at most max_concurrency at a time),
+    so responses may be written out of order; clients match them by id.
     """
 
-    def __init__(self, name: str, version: str = "1.0.0"):
+    def __init__(
+        self,
+        name: str,
+        version: str = "1.0.0",
+        framing: str = "newline",
+        max_concurrency: int = 5,
+    ):
+        if framing not in _FRAMINGS:
+            raise ValueError(f"Unknown framing: {framing} (expected one of {_FRAMINGS})")
+
         self.name = name
         self.version = version
+        self.framing = framing
+        self.max_concurrency = max_concurrency
         self.initialized = False
         self.client_info = None
+        self._request_semaphore = asyncio.Semaphore(max_concurrency)
+        self._pending_tasks: set[asyncio.Task] = set()
 
     @abstractmethod
     def get_tools(self) -> list[dict[str, Any]]:
@@ -46,7 +90,8 @@ class BaseMCPServer(ABC):
             arguments: Tool arguments from the client
 
         Returns:
-            Tool execution result
+            Tool execution result (the complete {"content": ...} result when the
+            implementation is decorated with @prewrapped)
 
         Raises:
             ValueError: If tool is not found or arguments are invalid
@@ -107,7 +152,12 @@ class BaseMCPServer(ABC):
             raise ValueError("Tool name is required")
 
         # Execute the tool
-        result = await self.handle_tool_call(tool_name, arguments)
+        handler = self.handle_tool_call
+        result = await handler(tool_name, arguments)
+
+        # Prewrapped handlers already return the tools/call result shape
+        if getattr(handler, "_prewrapped", False):
+            return result
 
         return {"content": result}
 
@@ -141,63 +191,151 @@ class BaseMCPServer(ABC):
         else:
             response["result"] = result
 
-        # Write to stdout
-        output = json.dumps(response) + "\n"
-        sys.stdout.write(output)
-        sys.stdout.flush()
+        # Write to stdout - orjson produces UTF-8 bytes, so skip the text layer
+        try:
+            body = orjson.dumps(response)
+        except orjson.JSONEncodeError:
+            # orjson rejects integers wider than 64 bits (e.g. calculator results)
+            body = json.dumps(response).encode()
+        if self.framing == "content-length":
+            sys.stdout.buffer.write(b"Content-Length: %d\r\n\r\n%s" % (len(body), body))
+        else:
+            sys.stdout.buffer.write(body + b"\n")
+        sys.stdout.buffer.flush()
+
+    def _parse_messages(self, buffer: bytearray) -> list[bytes]:
+        """Remove every complete message from the front of the buffer.
+
+        Args:
+            buffer: Bytes read from stdin so far; consumed messages are removed
+                in place and any incomplete trailing message is left behind
+
+        Returns:
+            Raw JSON payloads of the complete messages, in arrival order
+        """
+        messages = []
+
+        if self.framing == "content-length":
+            while True:
+                header_end = buffer.find(b"\r\n\r\n")
+                if header_end == -1:
+                    break
+
+                content_length = None
+                for header in bytes(buffer[:header_end]).split(b"\r\n"):
+                    name, _, value = header.partition(b":")
+                    if name.strip().lower() == b"content-length" and value.strip().isdigit():
+                        content_length = int(value)
+
+                if content_length is None:
+                    # Drop the malformed header block and resync on the next one
+                    logger.error("Invalid framing: missing or malformed Content-Length header")
+                    del buffer[: header_end + 4]
+                    continue
+
+                body_start = header_end + 4
+                body_end = body_start + content_length
+                if len(buffer) < body_end:
+                    break
+
+                messages.append(bytes(buffer[body_start:body_end]))
+                del buffer[:body_end]
+        else:
+            start = 0
+            while True:
+                newline = buffer.find(b"\n", start)
+                if newline == -1:
+                    break
+
+                line = bytes(buffer[start:newline]).strip()
+                if line:
+                    messages.append(line)
+                start = newline + 1
+
+            del buffer[:start]
+
+        return messages
+
+    async def _handle_message(self, payload: bytes) -> None:
+        """Parse, dispatch and answer a single JSON-RPC message."""
+        request: dict[str, Any] = {}
+
+        try:
+            # Parse JSON-RPC request
+            request = orjson.loads(payload)
+            request_id = request.get("id")
+            method = request.get("method")
+            params = request.get("params", {})
+
+            logger.debug(f"Received request: {method}")
+
+            # Handle request
+            result = await self.handle_request(method, params)
+
+            # Send response
+            await self.send_response(request_id, result=result)
+
+        except orjson.JSONDecodeError as e:
+            logger.error(f"Invalid JSON: {e}")
+            await self.send_response(
+                None,
+                error={"code": -32700, "message": "Parse error", "data": str(e)},
+            )
+
+        except ValueError as e:
+            logger.error(f"Invalid request: {e}")
+            await self.send_response(
+                request.get("id"),
+                error={"code": -32602, "message": "Invalid params", "data": str(e)},
+            )
+
+        except Exception as e:
+            logger.error(f"Internal error: {e}", exc_info=True)
+            await self.send_response(
+                request.get("id"),
+                error={"code": -32603, "message": "Internal error", "data": str(e)},
+            )
+
+    async def _dispatch(self, payload: bytes) -> None:
+        """Handle one message and free its concurrency slot when done."""
+        try:
+            await self._handle_message(payload)
+        finally:
+            self._request_semaphore.release()
 
     async def run(self):
         """Main server loop - read from stdin, process requests, write to stdout."""
         logger.info(f"Starting MCP server: {self.name} v{self.version}")
 
+        loop = asyncio.get_running_loop()
+        stdin_fd = sys.stdin.fileno()
+        buffer = bytearray()
+
         try:
-            # Read from stdin line by line
+            # Read stdin in pipe-buffer sized chunks and dispatch every complete
+            # message found in each chunk
             while True:
-                line = await asyncio.get_event_loop().run_in_executor(None, sys.stdin.readline)
+                chunk = await loop.run_in_executor(None, os.read, stdin_fd, _READ_CHUNK_SIZE)
 
-                if not line:
-                    # EOF reached
+                if not chunk:
+                    # EOF reached - a final newline-delimited message may lack its newline
+                    if self.framing == "newline" and buffer.strip():
+                        await self._handle_message(bytes(buffer).strip())
                     break
 
-                line = line.strip()
-                if not line:
-                    continue
+                buffer += chunk
+
+                for payload in self._parse_messages(buffer):
+                    # Wait for a free slot so a flood of requests can't outrun the
+                    # backing resources (e.g. a database connection pool)
+                    await self._request_semaphore.acquire()
+                    task = asyncio.create_task(self._dispatch(payload))
+                    self._pending_tasks.add(task)
+                    task.add_done_callback(self._pending_tasks.discard)
 
-                try:
-                    # Parse JSON-RPC request
-                    request = json.loads(line)
-                    request_id = request.get("id")
-                    method = request.get("method")
-                    params = request.get("params", {})
-
-                    logger.debug(f"Received request: {method}")
-
-                    # Handle request
-                    result = await self.handle_request(method, params)
-
-                    # Send response
-                    await self.send_response(request_id, result=result)
-
-                except json.JSONDecodeError as e:
-                    logger.error(f"Invalid JSON: {e}")
-                    await self.send_response(
-                        None,
-                        error={"code": -32700, "message": "Parse error", "data": str(e)},
-                    )
-
-                except ValueError as e:
-                    logger.error(f"Invalid request: {e}")
-                    await self.send_response(
-                        request.get("id"),
-                        error={"code": -32602, "message": "Invalid params", "data": str(e)},
-                    )
-
-                except Exception as e:
-                    logger.error(f"Internal error: {e}", exc_info=True)
-                    await self.send_response(
-                        request.get("id"),
-                        error={"code": -32603, "message": "Internal error", "data": str(e)},
-                    )
+            # Let in-flight requests finish and send their responses
+            if self._pending_tasks:
+                await asyncio.gather(*self._pending_tasks, return_exceptions=True)
 
         except KeyboardInterrupt:
             logger.info("Server interrupted")
@@ -216,5 +354,9 @@ def run_server(server: BaseMCPServer):
         handlers=[logging.StreamHandler(sys.stderr)],  # Log to stderr, not stdout
     )
 
-    # Run the server
-    asyncio.run(server.run())
+    # Run the server - on uvloop's libuv event loop when it's installed
+    if uvloop is not None:
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            runner.run(server.run())
+    else:
+        asyncio.run(server.run())
@@ -7,7 +7,71 @@ It provides basic calculator operations.
 
 from typing import Any
 
-from src.mcp_servers.base_server import BaseMCPServer, run_server
+from src.mcp_servers.base_server import BaseMCPServer, prewrapped, run_server
+
+# Tool definitions are static, so build them once at import time
+_CALCULATOR_TOOLS: list[dict[str, Any]] = [
+    {
+        "name": "add",
+        "description": "Add two numbers",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "a": {"type": "number", "description": "First number"},
+                "b": {"type": "number", "description": "Second number"},
+            },
+            "required": ["a", "b"],
+        },
+    },
+    {
+        "name": "subtract",
+        "description": "Subtract two numbers (a - b)",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "a": {"type": "number", "description": "Number to subtract from"},
+                "b": {"type": "number", "description": "Number to subtract"},
+            },
+            "required": ["a", "b"],
+        },
+    },
+    {
+        "name": "multiply",
+        "description": "Multiply two numbers",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "a": {"type": "number", "description": "First number"},
+                "b": {"type": "number", "description": "Second number"},
+            },
+            "required": ["a", "b"],
+        },
+    },
+    {
+        "name": "divide",
+        "description": "Divide two numbers (a / b)",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "a": {"type": "number", "description": "Dividend"},
+                "b": {"type": "number", "description": "Divisor"},
+            },
+            "required": ["a", "b"],
+        },
+    },
+    {
+        "name": "power",
+        "description": "Raise a number to a power (a ^ b)",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "base": {"type": "number", "description": "Base number"},
+                "exponent": {"type": "number", "description": "Exponent"},
+            },
+            "required": ["base", "exponent"],
+        },
+    },
+]
 
 
 class CalculatorMCPServer(BaseMCPServer):
@@ -19,87 +83,27 @@ class CalculatorMCPServer(BaseMCPServer):
 
     def get_tools(self) -> list[dict[str, Any]]:
         """Return calculator tool definitions."""
-        return [
-            {
-                "name": "add",
-                "description": "Add two numbers",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "a": {"type": "number", "description": "First number"},
-                        "b": {"type": "number", "description": "Second number"},
-                    },
-                    "required": ["a", "b"],
-                },
-            },
-            {
-                "name": "subtract",
-                "description": "Subtract two numbers (a - b)",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "a": {"type": "number", "description": "Number to subtract from"},
-                        "b": {"type": "number", "description": "Number to subtract"},
-                    },
-                    "required": ["a", "b"],
-                },
-            },
-            {
-                "name": "multiply",
-                "description": "Multiply two numbers",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "a": {"type": "number", "description": "First number"},
-                        "b": {"type": "number", "description": "Second number"},
-                    },
-                    "required": ["a", "b"],
-                },
-            },
-            {
-                "name": "divide",
-                "description": "Divide two numbers (a / b)",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "a": {"type": "number", "description": "Dividend"},
-                        "b": {"type": "number", "description": "Divisor"},
-                    },
-                    "required": ["a", "b"],
-                },
-            },
-            {
-                "name": "power",
-                "description": "Raise a number to a power (a ^ b)",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "base": {"type": "number", "description": "Base number"},
-                        "exponent": {"type": "number", "description": "Exponent"},
-                    },
-                    "required": ["base", "exponent"],
-                },
-            },
-        ]
+        return _CALCULATOR_TOOLS
 
+    @prewrapped
     async def handle_tool_call(self, tool_name: str, arguments: dict[str, Any]) -> Any:
-        """Execute calculator tool."""
+        """Execute calculator tool, returning the complete tools/call result."""
         if tool_name == "add":
-            return {"result": arguments["a"] + arguments["b"]}
+            return {"content": {"result": arguments["a"] + arguments["b"]}}
 
         elif tool_name == "subtract":
-            return {"result": arguments["a"] - arguments["b"]}
+            return {"content": {"result": arguments["a"] - arguments["b"]}}
 
         elif tool_name == "multiply":
-            return {"result": arguments["a"] * arguments["b"]}
+            return {"content": {"result": arguments["a"] * arguments["b"]}}
 
         elif tool_name == "divide":
             if arguments["b"] == 0:
                 raise ValueError("Division by zero")
-            return {"result": arguments["a"] / arguments["b"]}
+            return {"content": {"result": arguments["a"] / arguments["b"]}}
 
         elif tool_name == "power":
-            return {"result": arguments["base"] ** arguments["exponent"]}
+            return {"content": {"result": arguments["base"] ** arguments["exponent"]}}
 
         else:
             raise ValueError(f"Unknown tool: {tool_name}")
@@ -9,12 +9,83 @@ This server provides read-only database operations with:
 """
 
 import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from itertools import groupby
+from operator import itemgetter
 from typing import Any
 
 import asyncpg
 
 from src.mcp_servers.base_server import BaseMCPServer, run_server
 
+# Tool definitions are static, so build them once at import time
+_DATABASE_TOOLS: list[dict[str, Any]] = [
+    {
+        "name": "query",
+        "description": "Execute a SELECT query and return results",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "sql": {
+                    "type": "string",
+                    "description": "SQL SELECT query to execute",
+                },
+                "params": {
+                    "type": "array",
+                    "description": "Optional query parameters (for parameterized queries)",
+                    "items": {"type": ["string", "number", "boolean", "null"]},
+                },
+            },
+            "required": ["sql"],
+        },
+    },
+    {
+        "name": "list_tables",
+        "description": "List all tables in the database",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "schema": {
+                    "type": "string",
+                    "description": "Schema name (defaults to 'public')",
+                }
+            },
+        },
+    },
+    {
+        "name": "describe_table",
+        "description": "Get the schema/structure of a table",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "table_name": {
+                    "type": "string",
+                    "description": "Name of the table to describe",
+                },
+                "schema": {
+                    "type": "string",
+                    "description": "Schema name (defaults to 'public')",
+                },
+            },
+            "required": ["table_name"],
+        },
+    },
+    {
+        "name": "get_schema",
+        "description": "Get complete database schema with all tables and columns",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "schema": {
+                    "type": "string",
+                    "description": "Schema name (defaults to 'public')",
+                }
+            },
+        },
+    },
+]
+
 
 class DatabaseMCPServer(BaseMCPServer):
     """MCP server for database operations."""
@@ -25,6 +96,8 @@ class DatabaseMCPServer(BaseMCPServer):
         read_only: bool = True,
         max_rows: int = 1000,
         allowed_schemas: list[str] | None = None,
+        pool_min: int = 5,
+        pool_max: int = 20,
     ):
         """Initialize database server.
 
@@ -33,20 +106,71 @@ class DatabaseMCPServer(BaseMCPServer):
             read_only: If True, only allow SELECT queries
             max_rows: Maximum number of rows to return
             allowed_schemas: List of allowed schemas (defaults to public)
+            pool_min: Minimum number of pooled connections (opened at startup)
+            pool_max: Maximum number of pooled connections, also the number of
+                tool calls handled concurrently
         """
-        super().__init__(name="database-server", version="1.0.0")
+        super().__init__(name="database-server", version="1.0.0", max_concurrency=pool_max)
         self.database_url = database_url
         self.read_only = read_only
         self.max_rows = max_rows
         self.allowed_schemas = allowed_schemas or ["public"]
+        self.pool_min = pool_min
+        self.pool_max = pool_max
         self.pool = None
+        # Connection pinned for metadata tools (list_tables, describe_table, get_schema)
+        self._meta_conn = None
+        self._meta_lock = asyncio.Lock()
+
+        # Tool dispatch table, built once rather than per call
+        self._handlers = {
+            "query": self._query,
+            "list_tables": self._list_tables,
+            "describe_table": self._describe_table,
+            "get_schema": self._get_schema,
+        }
 
     async def _get_pool(self):
         """Get or create connection pool."""
         if not self.pool:
-            self.pool = await asyncpg.create_pool(self.database_url, min_size=1, max_size=5)
+            self.pool = await asyncpg.create_pool(
+                self.database_url,
+                min_size=self.pool_min,
+                max_size=self.pool_max,
+                max_inactive_connection_lifetime=300,
+                statement_cache_size=1024,
+                command_timeout=30,
+            )
         return self.pool
 
+    @asynccontextmanager
+    async def _metadata_connection(self) -> AsyncIterator[asyncpg.Connection]:
+        """Yield the pinned metadata connection, serializing its use.
+
+        The connection is acquired from the pool on first use and held until
+        the server shuts down, so metadata tools skip per-call pool acquire/release.
+        A connection that has been closed, or that fails with a connection error,
+        is dropped and replaced on the next call.
+        """
+        async with self._meta_lock:
+            if self._meta_conn is not None and self._meta_conn.is_closed():
+                await self._discard_metadata_connection()
+            if self._meta_conn is None:
+                pool = await self._get_pool()
+                self._meta_conn = await pool.acquire()
+            try:
+                yield self._meta_conn
+            except (asyncpg.PostgresConnectionError, asyncpg.InterfaceError, OSError):
+                await self._discard_metadata_connection()
+                raise
+
+    async def _discard_metadata_connection(self) -> None:
+        """Terminate the pinned metadata connection and hand it back to the pool."""
+        conn, self._meta_conn = self._meta_conn, None
+        if conn is not None:
+            conn.terminate()
+            await self.pool.release(conn)
+
     def _validate_query(self, query: str) -> None:
         """Validate query for safety.
 
@@ -72,84 +196,11 @@ class DatabaseMCPServer(BaseMCPServer):
 
     def get_tools(self) -> list[dict[str, Any]]:
         """Return database tool definitions."""
-        tools = [
-            {
-                "name": "query",
-                "description": "Execute a SELECT query and return results",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "sql": {
-                            "type": "string",
-                            "description": "SQL SELECT query to execute",
-                        },
-                        "params": {
-                            "type": "array",
-                            "description": "Optional query parameters (for parameterized queries)",
-                            "items": {"type": ["string", "number", "boolean", "null"]},
-                        },
-                    },
-                    "required": ["sql"],
-                },
-            },
-            {
-                "name": "list_tables",
-                "description": "List all tables in the database",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "schema": {
-                            "type": "string",
-                            "description": "Schema name (defaults to 'public')",
-                        }
-                    },
-                },
-            },
-            {
-                "name": "describe_table",
-                "description": "Get the schema/structure of a table",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "table_name": {
-                            "type": "string",
-                            "description": "Name of the table to describe",
-                        },
-                        "schema": {
-                            "type": "string",
-                            "description": "Schema name (defaults to 'public')",
-                        },
-                    },
-                    "required": ["table_name"],
-                },
-            },
-            {
-                "name": "get_schema",
-                "description": "Get complete database schema with all tables and columns",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "schema": {
-                            "type": "string",
-                            "description": "Schema name (defaults to 'public')",
-                        }
-                    },
-                },
-            },
-        ]
-
-        return tools
+        return _DATABASE_TOOLS
 
     async def handle_tool_call(self, tool_name: str, arguments: dict[str, Any]) -> Any:
         """Execute database tool."""
-        handlers = {
-            "query": self._query,
-            "list_tables": self._list_tables,
-            "describe_table": self._describe_table,
-            "get_schema": self._get_schema,
-        }
-
-        handler = handlers.get(tool_name)
+        handler = self._handlers.get(tool_name)
         if not handler:
             raise ValueError(f"Unknown tool: {tool_name}")
 
@@ -168,19 +219,25 @@ class DatabaseMCPServer(BaseMCPServer):
 
         # Execute query
         async with pool.acquire() as conn:
-            # Add LIMIT if not present
-            if "LIMIT" not in sql.upper():
-                sql = f"{sql.rstrip(';')} LIMIT {self.max_rows}"
+            # Read-only transaction as a second line of defense behind _validate_query.
+            # The query runs as written; a cursor reads at most one row past max_rows,
+            # which caps every statement and tells whether more rows were left.
+            async with conn.transaction(readonly=self.read_only):
+                cursor = await conn.cursor(sql, *params)
+                rows = await cursor.fetch(self.max_rows + 1)
 
-            rows = await conn.fetch(sql, *params)
+            truncated = len(rows) > self.max_rows
+            rows = rows[: self.max_rows]
 
-            # Convert rows to dictionaries
-            results = [dict(row) for row in rows]
+            # Convert rows to dictionaries - every row in a result shares the same
+            # column list, so resolve the keys once and zip them with each row's values
+            keys = list(rows[0].keys()) if rows else []
+            results = [dict(zip(keys, row.values())) for row in rows]
 
             return {
                 "rows": results,
                 "count": len(results),
-                "truncated": len(results) >= self.max_rows,
+                "truncated": truncated,
             }
 
     async def _list_tables(self, args: dict[str, Any]) -> dict[str, Any]:
@@ -191,11 +248,8 @@ class DatabaseMCPServer(BaseMCPServer):
         if schema not in self.allowed_schemas:
             raise ValueError(f"Schema '{schema}' is not in allowed schemas: {self.allowed_schemas}")
 
-        # Get connection pool
-        pool = await self._get_pool()
-
         # Query tables
-        async with pool.acquire() as conn:
+        async with self._metadata_connection() as conn:
             rows = await conn.fetch(
                 """
                 SELECT table_name, table_type
@@ -223,11 +277,8 @@ class DatabaseMCPServer(BaseMCPServer):
         if schema not in self.allowed_schemas:
             raise ValueError(f"Schema '{schema}' is not in allowed schemas: {self.allowed_schemas}")
 
-        # Get connection pool
-        pool = await self._get_pool()
-
         # Query table structure
-        async with pool.acquire() as conn:
+        async with self._metadata_connection() as conn:
             # Get columns
             columns = await conn.fetch(
                 """
@@ -290,68 +341,57 @@ class DatabaseMCPServer(BaseMCPServer):
         if schema not in self.allowed_schemas:
             raise ValueError(f"Schema '{schema}' is not in allowed schemas: {self.allowed_schemas}")
 
-        # Get connection pool
-        pool = await self._get_pool()
-
-        # Query schema
-        async with pool.acquire() as conn:
-            # Get all tables
-            tables = await conn.fetch(
+        # Query schema - tables and columns in a single round-trip
+        async with self._metadata_connection() as conn:
+            rows = await conn.fetch(
                 """
-                SELECT table_name
-                FROM information_schema.tables
-                WHERE table_schema = $1 AND table_type = 'BASE TABLE'
-                ORDER BY table_name
+                SELECT
+                    t.table_name,
+                    c.column_name,
+                    c.data_type,
+                    c.is_nullable
+                FROM information_schema.tables t
+                JOIN information_schema.columns c USING (table_schema, table_name)
+                WHERE t.table_schema = $1 AND t.table_type = 'BASE TABLE'
+                ORDER BY t.table_name, c.ordinal_position
                 """,
                 schema,
             )
 
-            schema_info = []
-
-            for table_row in tables:
-                table_name = table_row["table_name"]
-
-                # Get columns for this table
-                columns = await conn.fetch(
-                    """
-                    SELECT
-                        column_name,
-                        data_type,
-                        is_nullable
-                    FROM information_schema.columns
-                    WHERE table_schema = $1 AND table_name = $2
-                    ORDER BY ordinal_position
-                    """,
-                    schema,
-                    table_name,
-                )
-
-                schema_info.append(
+        # Rebuild the nested table -> columns structure from the flat rowset
+        schema_info = [
+            {
+                "table": table_name,
+                "columns": [
                     {
-                        "table": table_name,
-                        "columns": [
-                            {
-                                "name": col["column_name"],
-                                "type": col["data_type"],
-                                "nullable": col["is_nullable"] == "YES",
-                            }
-                            for col in columns
-                        ],
+                        "name": col["column_name"],
+                        "type": col["data_type"],
+                        "nullable": col["is_nullable"] == "YES",
                     }
-                )
-
-            return {
-                "schema": schema,
-                "tables": schema_info,
-                "table_count": len(schema_info),
+                    for col in columns
+                ],
             }
+            for table_name, columns in groupby(rows, key=itemgetter("table_name"))
+        ]
+
+        return {
+            "schema": schema,
+            "tables": schema_info,
+            "table_count": len(schema_info),
+        }
 
     async def run(self):
-        """Run server with connection pool cleanup."""
+        """Run server with connection pool warm-up and cleanup."""
+        # Open pool_min connections up front so the first request doesn't pay for it
+        await self._get_pool()
+
         try:
             await super().run()
         finally:
             if self.pool:
+                if self._meta_conn is not None:
+                    await self.pool.release(self._meta_conn)
+                    self._meta_conn = None
                 await self.pool.close()
 
 
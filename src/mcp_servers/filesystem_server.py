@@ -8,12 +8,172 @@ This server provides safe file system operations with:
 - Type validation
 """
 
+import asyncio
+import base64
+import codecs
+import errno
+import fnmatch
+import functools
 import os
 import pathlib
-from typing import Any
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from stat import S_ISDIR, S_ISLNK, S_ISREG
+from typing import Any, TypeVar
 
 from src.mcp_servers.base_server import BaseMCPServer, run_server
 
+T = TypeVar("T")
+
+# Tool definitions are static, so build them once at import time
+_FILESYSTEM_TOOLS: list[dict[str, Any]] = [
+    {
+        "name": "read_file",
+        "description": "Read the contents of a file",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "path": {
+                    "type": "string",
+                    "description": "Path to the file to read",
+                },
+                "binary": {
+                    "type": "boolean",
+                    "description": "Return raw bytes base64-encoded instead of UTF-8 text",
+                },
+                "offset": {
+                    "type": "integer",
+                    "description": "Byte offset to start reading at (for chunked reads)",
+                },
+                "length": {
+                    "type": "integer",
+                    "description": "Max bytes to read (defaults to the rest of the file)",
+                },
+            },
+            "required": ["path"],
+        },
+    },
+    {
+        "name": "write_file",
+        "description": "Write content to a file (creates or overwrites)",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "path": {
+                    "type": "string",
+                    "description": "Path to the file to write",
+                },
+                "content": {
+                    "type": "string",
+                    "description": "Content to write to the file",
+                },
+            },
+            "required": ["path", "content"],
+        },
+    },
+    {
+        "name": "list_directory",
+        "description": "List files and directories in a directory",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "path": {
+                    "type": "string",
+                    "description": "Path to the directory to list",
+                }
+            },
+            "required": ["path"],
+        },
+    },
+    {
+        "name": "create_directory",
+        "description": "Create a new directory",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "path": {
+                    "type": "string",
+                    "description": "Path to the directory to create",
+                }
+            },
+            "required": ["path"],
+        },
+    },
+    {
+        "name": "get_file_info",
+        "description": "Get information about a file or directory",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "path": {
+                    "type": "string",
+                    "description": "Path to get information about",
+                }
+            },
+            "required": ["path"],
+        },
+    },
+    {
+        "name": "delete_file",
+        "description": "Delete a file (use with caution)",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "path": {
+                    "type": "string",
+                    "description": "Path to the file to delete",
+                }
+            },
+            "required": ["path"],
+        },
+    },
+    {
+        "name": "search_files",
+        "description": "Search for files by name pattern in a directory",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "directory": {
+                    "type": "string",
+                    "description": "Directory to search in",
+                },
+                "pattern": {
+                    "type": "string",
+                    "description": "Glob pattern to match (e.g., '*.py', 'test_*.txt')",
+                },
+                "max_results": {
+                    "type": "integer",
+                    "description": "Maximum number of matches to return (defaults to 10000)",
+                },
+            },
+            "required": ["directory", "pattern"],
+        },
+    },
+]
+
+# Default and hard upper bound on the number of matches a single search returns
+_SEARCH_DEFAULT_RESULTS = 10_000
+_SEARCH_MAX_RESULTS = 100_000
+
+# Upper bound on parent directories remembered as existing by write_file
+_KNOWN_DIRS_MAX_ENTRIES = 1024
+
+# Upper bound on directories whose listings are kept for repeated searches
+_DIR_CACHE_MAX_ENTRIES = 4096
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_glob(pattern: str) -> tuple[re.Pattern | None, ...]:
+    """Compile a glob into one regex per path segment ("**" becomes None)."""
+    return tuple(
+        None if segment == "**" else re.compile(fnmatch.translate(segment))
+        for segment in pattern.split("/")
+        if segment
+    )
+
 
 class FilesystemMCPServer(BaseMCPServer):
     """MCP server for file system operations."""
@@ -29,6 +189,57 @@ class FilesystemMCPServer(BaseMCPServer):
         self.allowed_paths = [pathlib.Path(p).resolve() for p in (allowed_paths or ["/tmp"])]
         self.max_file_size = max_file_size
 
+        # Trie of allowed roots keyed by path component; a node holding the None key
+        # is the end of an allowed root and maps to that root's string form. Lookups
+        # cost O(depth) however many roots are configured.
+        self._allowed_trie: dict[str | None, Any] = {}
+        for allowed_path in self.allowed_paths:
+            node = self._allowed_trie
+            for part in str(allowed_path).rstrip(os.sep).split(os.sep):
+                node = node.setdefault(part, {})
+            node[None] = str(allowed_path)
+
+        # Blocking filesystem calls run here so a slow stat/read can't stall the event loop
+        self._executor = ThreadPoolExecutor(max_workers=32, thread_name_prefix="fs-io")
+
+        # Recently ensured parent directories, so repeated writes into the same
+        # directory skip the mkdir syscalls (LRU, guarded for the I/O threads)
+        self._known_dirs: OrderedDict[str, None] = OrderedDict()
+        self._known_dirs_lock = threading.Lock()
+
+        # Directory fds for the allowed roots, opened on first use, so file opens can be
+        # anchored to them with dir_fd
+        self._root_fds: dict[str, int] = {}
+
+        # Directory listings for search_files: path -> (st_mtime_ns, [(name, is_dir, is_symlink)])
+        self._dir_cache: dict[str, tuple[int, list[tuple[str, bool, bool]]]] = {}
+
+        # Tool dispatch table, built once rather than per call
+        self._handlers = {
+            "read_file": self._read_file,
+            "write_file": self._write_file,
+            "list_directory": self._list_directory,
+            "create_directory": self._create_directory,
+            "get_file_info": self._get_file_info,
+            "delete_file": self._delete_file,
+            "search_files": self._search_files,
+        }
+
+    def _allowed_root(self, resolved: str) -> str | None:
+        """Return the allowed root containing an already-resolved path, if any."""
+        node = self._allowed_trie
+        for part in resolved.rstrip(os.sep).split(os.sep):
+            node = node.get(part)
+            if node is None:
+                return None
+            if None in node:
+                return node[None]
+        return None
+
+    def _is_allowed(self, resolved: str) -> bool:
+        """Check whether an already-resolved path is inside an allowed directory."""
+        return self._allowed_root(resolved) is not None
+
     def _validate_path(self, file_path: str) -> pathlib.Path:
         """Validate and resolve file path.
 
@@ -42,177 +253,204 @@ class FilesystemMCPServer(BaseMCPServer):
             ValueError: If path is invalid or outside allowed directories
         """
         # Resolve to absolute path
-        path = pathlib.Path(file_path).resolve()
+        resolved = os.path.realpath(file_path)
 
         # Check if path is within allowed directories
-        allowed = False
-        for allowed_path in self.allowed_paths:
-            try:
-                path.relative_to(allowed_path)
-                allowed = True
-                break
-            except ValueError:
-                continue
-
-        if not allowed:
+        if not self._is_allowed(resolved):
             raise ValueError(
                 f"Path {file_path} is not within allowed directories: "
                 f"{[str(p) for p in self.allowed_paths]}"
             )
 
-        return path
+        return pathlib.Path(resolved)
 
     def get_tools(self) -> list[dict[str, Any]]:
         """Return filesystem tool definitions."""
-        return [
-            {
-                "name": "read_file",
-                "description": "Read the contents of a file",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "path": {
-                            "type": "string",
-                            "description": "Path to the file to read",
-                        }
-                    },
-                    "required": ["path"],
-                },
-            },
-            {
-                "name": "write_file",
-                "description": "Write content to a file (creates or overwrites)",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "path": {
-                            "type": "string",
-                            "description": "Path to the file to write",
-                        },
-                        "content": {
-                            "type": "string",
-                            "description": "Content to write to the file",
-                        },
-                    },
-                    "required": ["path", "content"],
-                },
-            },
-            {
-                "name": "list_directory",
-                "description": "List files and directories in a directory",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "path": {
-                            "type": "string",
-                            "description": "Path to the directory to list",
-                        }
-                    },
-                    "required": ["path"],
-                },
-            },
-            {
-                "name": "create_directory",
-                "description": "Create a new directory",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "path": {
-                            "type": "string",
-                            "description": "Path to the directory to create",
-                        }
-                    },
-                    "required": ["path"],
-                },
-            },
-            {
-                "name": "get_file_info",
-                "description": "Get information about a file or directory",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "path": {
-                            "type": "string",
-                            "description": "Path to get information about",
-                        }
-                    },
-                    "required": ["path"],
-                },
-            },
-            {
-                "name": "delete_file",
-                "description": "Delete a file (use with caution)",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "path": {
-                            "type": "string",
-                            "description": "Path to the file to delete",
-                        }
-                    },
-                    "required": ["path"],
-                },
-            },
-            {
-                "name": "search_files",
-                "description": "Search for files by name pattern in a directory",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "directory": {
-                            "type": "string",
-                            "description": "Directory to search in",
-                        },
-                        "pattern": {
-                            "type": "string",
-                            "description": "Glob pattern to match (e.g., '*.py', 'test_*.txt')",
-                        },
-                    },
-                    "required": ["directory", "pattern"],
-                },
-            },
-        ]
+        return _FILESYSTEM_TOOLS
 
     async def handle_tool_call(self, tool_name: str, arguments: dict[str, Any]) -> Any:
         """Execute filesystem tool."""
-        handlers = {
-            "read_file": self._read_file,
-            "write_file": self._write_file,
-            "list_directory": self._list_directory,
-            "create_directory": self._create_directory,
-            "get_file_info": self._get_file_info,
-            "delete_file": self._delete_file,
-            "search_files": self._search_files,
-        }
-
-        handler = handlers.get(tool_name)
+        handler = self._handlers.get(tool_name)
         if not handler:
             raise ValueError(f"Unknown tool: {tool_name}")
 
         return await handler(arguments)
 
-    async def _read_file(self, args: dict[str, Any]) -> dict[str, Any]:
-        """Read file contents."""
-        path = self._validate_path(args["path"])
+    def _open_beneath(self, path: pathlib.Path, flags: int, mode: int = 0o666) -> int:
+        """Open a validated path without following symlinks in any component.
 
-        if not path.exists():
-            raise ValueError(f"File not found: {path}")
+        _validate_path checks the realpath, but a component could be swapped for a
+        symlink between that check and the open. Walking down from the allowed
+        root's fd with O_NOFOLLOW makes the kernel refuse such a path.
 
-        if not path.is_file():
+        Args:
+            path: Path returned by _validate_path
+            flags: os.open flags for the final component
+            mode: Permission bits for newly created files
+
+        Returns:
+            Open file descriptor (caller closes it)
+
+        Raises:
+            ValueError: If the path is outside the allowed roots or contains a symlink
+        """
+        path_str = str(path)
+        root = self._allowed_root(path_str)
+        if root is None or path_str == root:
             raise ValueError(f"Path is not a file: {path}")
 
-        # Check file size
-        size = path.stat().st_size
-        if size > self.max_file_size:
-            raise ValueError(f"File too large: {size} bytes (max {self.max_file_size})")
+        root_fd = self._root_fds.get(root)
+        if root_fd is None:
+            root_fd = os.open(root, os.O_RDONLY | os.O_DIRECTORY)
+            if self._root_fds.setdefault(root, root_fd) != root_fd:
+                # Another thread opened it first
+                os.close(root_fd)
+                root_fd = self._root_fds[root]
+
+        *parents, name = pathlib.PurePath(os.path.relpath(path_str, root)).parts
+        dir_fd = root_fd
+        try:
+            for part in parents:
+                try:
+                    next_fd = os.open(
+                        part, os.O_RDONLY | os.O_DIRECTORY | os.O_NOFOLLOW, dir_fd=dir_fd
+                    )
+                except NotADirectoryError:
+                    # O_DIRECTORY reports a symlinked directory as ENOTDIR
+                    if S_ISLNK(os.lstat(part, dir_fd=dir_fd).st_mode):
+                        raise ValueError(f"Symlinks are not allowed: {path}") from None
+                    raise
+                if dir_fd != root_fd:
+                    os.close(dir_fd)
+                dir_fd = next_fd
+
+            try:
+                return os.open(name, flags | os.O_NOFOLLOW, mode, dir_fd=dir_fd)
+            except OSError as e:
+                if e.errno == errno.ELOOP:
+                    raise ValueError(f"Symlinks are not allowed: {path}") from None
+                raise
+        finally:
+            if dir_fd != root_fd:
+                os.close(dir_fd)
+
+    def _stat_or_raise(
+        self, path: pathlib.Path, kind: str | None = None, missing: str = "Path"
+    ) -> os.stat_result:
+        """Stat a path once, raising the tool's usual errors.
 
-        # Read file
-        content = path.read_text(encoding="utf-8")
+        Args:
+            path: Path to stat
+            kind: Required type - "file", "directory" or None for any
+            missing: Noun used in the not-found error message
+
+        Returns:
+            Stat result for callers to reuse (size, mtime, mode)
+
+        Raises:
+            ValueError: If the path doesn't exist or is not of the required kind
+        """
+        try:
+            st = os.stat(path)
+        except (FileNotFoundError, NotADirectoryError):
+            raise ValueError(f"{missing} not found: {path}") from None
+
+        if kind == "file" and not S_ISREG(st.st_mode):
+            raise ValueError(f"Path is not a file: {path}")
+        if kind == "directory" and not S_ISDIR(st.st_mode):
+            raise ValueError(f"Path is not a directory: {path}")
+
+        return st
+
+    async def _run_blocking(self, func: Callable[..., T], *args: Any) -> T:
+        """Run a blocking filesystem helper on the I/O thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    async def _read_file(self, args: dict[str, Any]) -> dict[str, Any]:
+        """Read file contents, optionally a byte range of them.
+
+        Large files can be read in chunks by advancing offset by bytes_read until
+        eof is true; the size limit applies to each chunk. Text chunks end on a
+        character boundary, so bytes_read can be less than length. With binary set
+        the bytes are returned base64-encoded and never decoded as text.
+        """
+        path = self._validate_path(args["path"])
+        binary = args.get("binary", False)
+        offset = args.get("offset", 0)
+        length = args.get("length")
+
+        if offset < 0 or (length is not None and length < 0):
+            raise ValueError("offset and length must be non-negative")
+
+        return await self._run_blocking(self._read_file_sync, path, binary, offset, length)
+
+    def _read_file_sync(
+        self, path: pathlib.Path, binary: bool, offset: int, length: int | None
+    ) -> dict[str, Any]:
+        """Blocking part of read_file."""
+        # O_NONBLOCK keeps a FIFO from blocking the open; regular files ignore it
+        try:
+            fd = self._open_beneath(path, os.O_RDONLY | os.O_NONBLOCK)
+        except (FileNotFoundError, NotADirectoryError):
+            raise ValueError(f"File not found: {path}") from None
+
+        st = os.fstat(fd)
+        if not S_ISREG(st.st_mode):
+            os.close(fd)
+            raise ValueError(f"Path is not a file: {path}")
+        size = st.st_size
+
+        with open(fd, "rb", buffering=0) as f:
+            # Check size of the requested range
+            to_read = max(size - offset, 0)
+            if length is not None:
+                to_read = min(to_read, length)
+            if to_read > self.max_file_size:
+                raise ValueError(f"File too large: {to_read} bytes (max {self.max_file_size})")
+
+            if offset:
+                f.seek(offset)
+
+            # Read straight into a buffer of the known size
+            buffer = bytearray(to_read)
+            view = memoryview(buffer)
+            read = 0
+            while read < to_read:
+                n = f.readinto(view[read:])
+                if not n:
+                    break
+                read += n
+            view.release()
+
+        if read < to_read:
+            del buffer[read:]
+
+        if binary:
+            content = base64.b64encode(buffer).decode("ascii")
+        else:
+            # A chunk may end partway through a character: decode only whole
+            # characters and leave the split tail to start the next chunk
+            decoder = codecs.getincrementaldecoder("utf-8")()
+            try:
+                content = decoder.decode(buffer, final=offset + read >= size)
+            except UnicodeDecodeError as e:
+                raise ValueError(
+                    f"Bytes {offset + e.start}-{offset + e.end} of {path} are not valid "
+                    "UTF-8; read the file with binary set"
+                ) from None
+            read -= len(decoder.getstate()[0])
+            if buffer and not read:
+                raise ValueError("length is too short to hold a whole UTF-8 character")
 
         return {
             "path": str(path),
             "content": content,
+            "encoding": "base64" if binary else "utf-8",
             "size": size,
+            "offset": offset,
+            "bytes_read": read,
+            "eof": offset + read >= size,
         }
 
     async def _write_file(self, args: dict[str, Any]) -> dict[str, Any]:
@@ -225,11 +463,7 @@ class FilesystemMCPServer(BaseMCPServer):
         if len(content_bytes) > self.max_file_size:
             raise ValueError(f"Content too large: {len(content_bytes)} bytes (max {self.max_file_size})")
 
-        # Create parent directory if needed
-        path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Write file
-        path.write_text(content, encoding="utf-8")
+        await self._run_blocking(self._write_file_sync, path, content_bytes)
 
         return {
             "path": str(path),
@@ -237,24 +471,62 @@ class FilesystemMCPServer(BaseMCPServer):
             "message": "File written successfully",
         }
 
+    def _write_file_sync(self, path: pathlib.Path, content_bytes: bytes) -> None:
+        """Blocking part of write_file."""
+        # Create parent directory if needed
+        parent = str(path.parent)
+        self._ensure_directory(parent)
+
+        # Write file - reuse the already-encoded bytes
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+        try:
+            fd = self._open_beneath(path, flags)
+        except FileNotFoundError:
+            # A remembered parent was removed behind our back - recreate it
+            self._ensure_directory(parent, force=True)
+            fd = self._open_beneath(path, flags)
+        try:
+            view = memoryview(content_bytes)
+            while view:
+                view = view[os.write(fd, view) :]
+        finally:
+            os.close(fd)
+
+    def _ensure_directory(self, directory: str, force: bool = False) -> None:
+        """Create a directory (and parents) unless it was recently seen to exist."""
+        with self._known_dirs_lock:
+            if not force and directory in self._known_dirs:
+                self._known_dirs.move_to_end(directory)
+                return
+
+        os.makedirs(directory, exist_ok=True)
+
+        with self._known_dirs_lock:
+            self._known_dirs[directory] = None
+            if len(self._known_dirs) > _KNOWN_DIRS_MAX_ENTRIES:
+                self._known_dirs.popitem(last=False)
+
     async def _list_directory(self, args: dict[str, Any]) -> dict[str, Any]:
         """List directory contents."""
         path = self._validate_path(args["path"])
+        return await self._run_blocking(self._list_directory_sync, path)
 
-        if not path.exists():
-            raise ValueError(f"Directory not found: {path}")
+    def _list_directory_sync(self, path: pathlib.Path) -> dict[str, Any]:
+        """Blocking part of list_directory."""
+        self._stat_or_raise(path, "directory", "Directory")
 
-        if not path.is_dir():
-            raise ValueError(f"Path is not a directory: {path}")
+        # List contents - scandir entries carry the file type from readdir, so
+        # each child costs a single stat call
+        with os.scandir(path) as it:
+            children = sorted(it, key=lambda e: e.name)
 
-        # List contents
         entries = []
-        for entry in sorted(path.iterdir()):
+        for entry in children:
             stat = entry.stat()
             entries.append(
                 {
                     "name": entry.name,
-                    "path": str(entry),
+                    "path": entry.path,
                     "type": "directory" if entry.is_dir() else "file",
                     "size": stat.st_size if entry.is_file() else None,
                     "modified": stat.st_mtime,
@@ -270,93 +542,194 @@ class FilesystemMCPServer(BaseMCPServer):
     async def _create_directory(self, args: dict[str, Any]) -> dict[str, Any]:
         """Create a directory."""
         path = self._validate_path(args["path"])
+        await self._run_blocking(self._create_directory_sync, path)
+
+        return {
+            "path": str(path),
+            "message": "Directory created successfully",
+        }
 
+    def _create_directory_sync(self, path: pathlib.Path) -> None:
+        """Blocking part of create_directory."""
         if path.exists():
             raise ValueError(f"Path already exists: {path}")
 
         # Create directory
         path.mkdir(parents=True, exist_ok=False)
 
-        return {
-            "path": str(path),
-            "message": "Directory created successfully",
-        }
-
     async def _get_file_info(self, args: dict[str, Any]) -> dict[str, Any]:
         """Get file/directory information."""
         path = self._validate_path(args["path"])
+        return await self._run_blocking(self._get_file_info_sync, path)
 
-        if not path.exists():
-            raise ValueError(f"Path not found: {path}")
-
-        stat = path.stat()
+    def _get_file_info_sync(self, path: pathlib.Path) -> dict[str, Any]:
+        """Blocking part of get_file_info."""
+        stat = self._stat_or_raise(path)
 
         return {
             "path": str(path),
             "name": path.name,
-            "type": "directory" if path.is_dir() else "file",
+            "type": "directory" if S_ISDIR(stat.st_mode) else "file",
             "size": stat.st_size,
             "created": stat.st_ctime,
             "modified": stat.st_mtime,
-            "permissions": oct(stat.st_mode)[-3:],
+            "permissions": f"{stat.st_mode & 0o777:03o}",
         }
 
     async def _delete_file(self, args: dict[str, Any]) -> dict[str, Any]:
         """Delete a file."""
         path = self._validate_path(args["path"])
+        await self._run_blocking(self._delete_file_sync, path)
 
-        if not path.exists():
-            raise ValueError(f"File not found: {path}")
+        return {
+            "path": str(path),
+            "message": "File deleted successfully",
+        }
+
+    def _delete_file_sync(self, path: pathlib.Path) -> None:
+        """Blocking part of delete_file."""
+        st = self._stat_or_raise(path, missing="File")
 
-        if path.is_dir():
+        if S_ISDIR(st.st_mode):
             raise ValueError(f"Cannot delete directory (use rmdir): {path}")
 
         # Delete file
         path.unlink()
 
-        return {
-            "path": str(path),
-            "message": "File deleted successfully",
-        }
-
     async def _search_files(self, args: dict[str, Any]) -> dict[str, Any]:
         """Search for files matching a pattern."""
         directory = self._validate_path(args["directory"])
-        pattern = args["pattern"]
-
-        if not directory.exists():
-            raise ValueError(f"Directory not found: {directory}")
+        max_results = min(int(args.get("max_results", _SEARCH_DEFAULT_RESULTS)), _SEARCH_MAX_RESULTS)
+        if max_results < 1:
+            raise ValueError("max_results must be positive")
+
+        return await self._run_blocking(
+            self._search_files_sync, directory, args["pattern"], max_results
+        )
+
+    def _search_files_sync(
+        self, directory: pathlib.Path, pattern: str, max_results: int
+    ) -> dict[str, Any]:
+        """Blocking part of search_files."""
+        self._stat_or_raise(directory, "directory", "Directory")
+
+        # Split off the literal leading components of the pattern (e.g. "src/api" in
+        # "src/api/*.py") so only the directory they name is walked
+        parts = pathlib.PurePath(pattern).parts
+        split = next(
+            (i for i, part in enumerate(parts) if any(c in part for c in "*?[")), len(parts)
+        )
+        base = directory.joinpath(*parts[:split])
+        tail = "/".join(parts[split:])
+
+        # The literal prefix may contain ".." or symlinks, so resolve it once; below it,
+        # only entries reached through a symlink can lead outside the allowed paths
+        if not self._is_allowed(os.path.realpath(base)):
+            candidates = []
+        elif tail:
+            candidates = self._glob(str(base), _compile_glob(tail))
+        else:
+            candidates = [(str(base), False)] if base.exists() else []
+
+        # Search for files - candidates are generated lazily, so stopping at
+        # max_results also stops the directory walk
+        matches = []
+        truncated = False
+        for match, via_symlink in candidates:
+            if len(matches) >= max_results:
+                truncated = True
+                break
 
-        if not directory.is_dir():
-            raise ValueError(f"Path is not a directory: {directory}")
+            if via_symlink and not self._is_allowed(os.path.realpath(match)):
+                continue
 
-        # Search for files
-        matches = []
-        for match in directory.glob(pattern):
-            # Ensure match is within allowed paths
             try:
-                self._validate_path(str(match))
-                stat = match.stat()
-                matches.append(
-                    {
-                        "name": match.name,
-                        "path": str(match),
-                        "type": "directory" if match.is_dir() else "file",
-                        "size": stat.st_size if match.is_file() else None,
-                        "modified": stat.st_mtime,
-                    }
-                )
-            except ValueError:
-                # Skip files outside allowed paths
+                stat = os.stat(match)
+            except OSError:
                 continue
 
+            matches.append(
+                {
+                    "name": os.path.basename(match),
+                    "path": match,
+                    "type": "directory" if S_ISDIR(stat.st_mode) else "file",
+                    "size": stat.st_size if S_ISREG(stat.st_mode) else None,
+                    "modified": stat.st_mtime,
+                }
+            )
+
         return {
             "directory": str(directory),
             "pattern": pattern,
             "matches": matches,
             "count": len(matches),
+            "truncated": truncated,
         }
 
+    def _list_dir_cached(self, path: str) -> list[tuple[str, bool, bool]]:
+        """List a directory, reusing the previous listing while its mtime is unchanged."""
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return []
+
+        cached = self._dir_cache.get(path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+        try:
+            with os.scandir(path) as it:
+                entries = [(e.name, e.is_dir(), e.is_symlink()) for e in it]
+        except OSError:
+            return []
+
+        if len(self._dir_cache) >= _DIR_CACHE_MAX_ENTRIES:
+            self._dir_cache.clear()
+        self._dir_cache[path] = (mtime, entries)
+        return entries
+
+    def _glob(
+        self, base: str, segments: tuple[re.Pattern | None, ...], via_symlink: bool = False
+    ) -> Iterator[tuple[str, bool]]:
+        """Yield (path, via_symlink) for paths under base matching compiled glob segments.
+
+        via_symlink is True when any component walked below base is a symlink.
+        """
+        if not segments:
+            yield base, via_symlink
+            return
+
+        segment, rest = segments[0], segments[1:]
+
+        if segment is None:
+            # "**" matches zero or more directories; like pathlib, don't descend
+            # through symlinked directories
+            yield from self._glob(base, rest, via_symlink)
+            for name, is_dir, is_symlink in self._list_dir_cached(base):
+                if is_dir and not is_symlink:
+                    yield from self._glob(os.path.join(base, name), segments, via_symlink)
+            return
+
+        for name, is_dir, is_symlink in self._list_dir_cached(base):
+            if not segment.match(name):
+                continue
+            if not rest:
+                yield os.path.join(base, name), via_symlink or is_symlink
+            elif is_dir:
+                yield from self._glob(
+                    os.path.join(base, name), rest, via_symlink or is_symlink
+                )
+
+    async def run(self):
+        """Run server and shut down the I/O thread pool on exit."""
+        try:
+            await super().run()
+        finally:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            for fd in self._root_fds.values():
+                os.close(fd)
+            self._root_fds.clear()
+
 
 def main():
     """Main entry point."""
@@ -4,7 +4,9 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, TypeAdapter, Field
+
+from src.schemas.base import ORMResponseModel
 
 
 class AgentCreate(BaseModel):
@@ -46,7 +48,7 @@ class AgentUpdate(BaseModel):
     extra_metadata: dict[str, Any] | None = None
 
 
-class AgentResponse(BaseModel):
+class AgentResponse(ORMResponseModel):
     """Agent response schema."""
 
     id: UUID
@@ -72,8 +74,6 @@ class AgentResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    model_config = {"from_attributes": True}
-
 
 class AgentListResponse(BaseModel):
     """Agent list response schema."""
@@ -118,3 +118,8 @@ class AgentExecuteResponse(BaseModel):
     token_usage: TokenUsage | None = None
     latency_ms: int | None = None
     created_at: datetime
+
+
+# List adapters, built once at import: validating a whole page of ORM rows in one
+# pydantic-core call is cheaper than calling model_validate per row
+AGENT_LIST_ADAPTER = TypeAdapter(list[AgentResponse])
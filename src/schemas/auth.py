@@ -2,6 +2,8 @@
 
 from pydantic import BaseModel, EmailStr
 
+from src.schemas.base import ORMResponseModel
+
 
 class LoginRequest(BaseModel):
     """Login request schema."""
@@ -19,11 +21,13 @@ class TokenResponse(BaseModel):
     user: "UserResponse"
 
 
-class UserResponse(BaseModel):
+class UserResponse(ORMResponseModel):
     """User response schema."""
 
     id: str
     email: str
     role: str
 
-    model_config = {"from_attributes": True}
+
+# Resolve the "UserResponse" forward reference now rather than on first login
+TokenResponse.model_rebuild()
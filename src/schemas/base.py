@@ -0,0 +1,53 @@
+"""Shared base classes for API schemas."""
+
+from typing import Annotated, Any, Self
+
+from pydantic import BaseModel, ConfigDict, PlainValidator, ValidationError
+
+_MISSING = object()
+
+# JSON object read from a trusted JSONB column. Validation hands the value through
+# by reference instead of walking and copying it; it still serializes as an object.
+RawJSON = Annotated[dict[str, Any], PlainValidator(lambda value: value)]
+
+
+class ORMResponseModel(BaseModel):
+    """Base for response schemas built from ORM rows.
+
+    Responses are read from database objects and never modified after
+    construction, so they are frozen. Unknown keyword arguments are rejected
+    rather than silently dropped.
+    """
+
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
+
+    @classmethod
+    def from_orm_fast(cls, obj: Any, **overrides: Any) -> Self:
+        """Build a response from a trusted ORM row without validation.
+
+        Field values are copied straight from the row's attributes, read under the
+        field's string ``validation_alias`` when it has one. Optional fields the row
+        lacks fall back to their defaults; a missing required field raises, so a
+        schema that drifts from its model fails loudly instead of producing an
+        incomplete response. Only use this for data read from our own database.
+
+        Args:
+            obj: ORM instance to read fields from
+            **overrides: Field values to use instead of the row's attributes
+
+        Raises:
+            ValidationError: If a required field is neither on the row nor overridden
+        """
+        values = dict(overrides)
+        for name, field in cls.model_fields.items():
+            if name in overrides:
+                continue
+            source = field.validation_alias if isinstance(field.validation_alias, str) else name
+            value = getattr(obj, source, _MISSING)
+            if value is not _MISSING:
+                values[name] = value
+            elif field.is_required():
+                raise ValidationError.from_exception_data(
+                    cls.__name__, [{"type": "missing", "loc": (name,), "input": obj}]
+                )
+        return cls.model_construct(**values)
@@ -4,10 +4,12 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
+from src.schemas.base import ORMResponseModel
 
-class MessageResponse(BaseModel):
+
+class MessageResponse(ORMResponseModel):
     """Message response schema."""
 
     id: UUID
@@ -17,10 +19,8 @@ class MessageResponse(BaseModel):
     token_count: int | None = None
     tool_calls: list[dict[str, Any]] | None = None
 
-    model_config = {"from_attributes": True}
-
 
-class ConversationResponse(BaseModel):
+class ConversationResponse(ORMResponseModel):
     """Conversation response schema."""
 
     id: UUID
@@ -35,11 +35,13 @@ class ConversationResponse(BaseModel):
     started_at: datetime
     completed_at: datetime | None = None
 
-    model_config = {"from_attributes": True}
-
 
 class ConversationListResponse(BaseModel):
     """Conversation list response schema."""
 
     data: list[ConversationResponse]
     pagination: dict[str, Any]
+
+
+# Batch validator for a conversation's messages
+MESSAGE_LIST_ADAPTER = TypeAdapter(list[MessageResponse])
@@ -4,7 +4,9 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, TypeAdapter, Field
+
+from src.schemas.base import ORMResponseModel
 
 
 # ============================================================================
@@ -66,7 +68,7 @@ class MCPServerUpdate(BaseModel):
     extra_metadata: dict[str, Any] | None = None
 
 
-class MCPServerResponse(BaseModel):
+class MCPServerResponse(ORMResponseModel):
     """MCP server response schema."""
 
     id: UUID
@@ -97,17 +99,16 @@ class MCPServerResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    model_config = {"from_attributes": True}
-
 
 class MCPServerListResponse(BaseModel):
     """MCP server list response schema."""
 
     servers: list[MCPServerResponse]
-    total: int
+    total: int = Field(-1, description="Deprecated: -1 unless include_total is requested")
     page: int
     page_size: int
     has_more: bool
+    next_cursor: str | None = Field(None, description="Pass as cursor to fetch the next page")
 
 
 # ============================================================================
@@ -127,6 +128,9 @@ class MCPServerConfigCreate(BaseModel):
     denied_tools: list[str] | None = Field(None, description="Blacklist of tools")
     timeout_seconds: int = Field(default=30, gt=0)
     max_retries: int = Field(default=3, ge=0)
+    max_concurrent_requests: int = Field(
+        default=8, gt=0, description="Requests in flight per server process; more wait their turn"
+    )
     rate_limit_per_minute: int | None = Field(None, gt=0)
     extra_metadata: dict[str, Any] | None = None
 
@@ -141,11 +145,12 @@ class MCPServerConfigUpdate(BaseModel):
     denied_tools: list[str] | None = None
     timeout_seconds: int | None = Field(None, gt=0)
     max_retries: int | None = Field(None, ge=0)
+    max_concurrent_requests: int | None = Field(None, gt=0)
     rate_limit_per_minute: int | None = Field(None, gt=0)
     extra_metadata: dict[str, Any] | None = None
 
 
-class MCPServerConfigResponse(BaseModel):
+class MCPServerConfigResponse(ORMResponseModel):
     """MCP server configuration response schema."""
 
     id: UUID
@@ -159,13 +164,12 @@ class MCPServerConfigResponse(BaseModel):
     denied_tools: list[str] | None
     timeout_seconds: int
     max_retries: int
+    max_concurrent_requests: int
     rate_limit_per_minute: int | None
     extra_metadata: dict[str, Any] | None
     created_at: datetime
     updated_at: datetime
 
-    model_config = {"from_attributes": True}
-
 
 # ============================================================================
 # MCP Tool Execution Schemas
@@ -183,7 +187,7 @@ class MCPToolExecuteRequest(BaseModel):
     timeout_seconds: int | None = Field(None, gt=0)
 
 
-class MCPToolExecuteResponse(BaseModel):
+class MCPToolExecuteResponse(ORMResponseModel):
     """MCP tool execution response schema."""
 
     execution_id: UUID
@@ -197,10 +201,8 @@ class MCPToolExecuteResponse(BaseModel):
     started_at: datetime
     completed_at: datetime | None
 
-    model_config = {"from_attributes": True}
-
 
-class MCPToolExecutionResponse(BaseModel):
+class MCPToolExecutionResponse(ORMResponseModel):
     """MCP tool execution history response schema."""
 
     id: UUID
@@ -224,17 +226,16 @@ class MCPToolExecutionResponse(BaseModel):
     started_at: datetime
     completed_at: datetime | None
 
-    model_config = {"from_attributes": True}
-
 
 class MCPToolExecutionListResponse(BaseModel):
     """MCP tool execution list response schema."""
 
     executions: list[MCPToolExecutionResponse]
-    total: int
+    total: int = Field(-1, description="Deprecated: -1 unless include_total is requested")
     page: int
     page_size: int
     has_more: bool
+    next_cursor: str | None = Field(None, description="Pass as cursor to fetch the next page")
 
 
 # ============================================================================
@@ -284,7 +285,7 @@ class MCPRegistryServerUpdate(BaseModel):
     extra_metadata: dict[str, Any] | None = None
 
 
-class MCPRegistryServerResponse(BaseModel):
+class MCPRegistryServerResponse(ORMResponseModel):
     """MCP registry server response schema."""
 
     id: UUID
@@ -319,17 +320,16 @@ class MCPRegistryServerResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    model_config = {"from_attributes": True}
-
 
 class MCPRegistryServerListResponse(BaseModel):
     """MCP registry server list response schema."""
 
     servers: list[MCPRegistryServerResponse]
-    total: int
+    total: int = Field(-1, description="Deprecated: -1 unless include_total is requested")
     page: int
     page_size: int
     has_more: bool
+    next_cursor: str | None = Field(None, description="Pass as cursor to fetch the next page")
 
 
 # ============================================================================
@@ -353,3 +353,8 @@ class MCPServerDiscoveryResponse(BaseModel):
 
     servers: list[MCPServerConnectionInfo]
     total_available: int
+
+
+# Validate a page of ORM rows in one call for the list endpoints
+MCP_SERVER_LIST_ADAPTER = TypeAdapter(list[MCPServerResponse])
+MCP_TOOL_EXECUTION_LIST_ADAPTER = TypeAdapter(list[MCPToolExecutionResponse])
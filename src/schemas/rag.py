@@ -1,11 +1,15 @@
 """RAG (Retrieval-Augmented Generation) schemas."""
 
 from datetime import datetime
-from typing import Any
+from typing import Any, Literal
 from uuid import UUID
 
 from pydantic import BaseModel, Field
 
+from src.schemas.base import ORMResponseModel, RawJSON
+
+Visibility = Literal["private", "shared", "public"]
+
 
 class CollectionCreate(BaseModel):
     """Collection creation schema."""
@@ -16,7 +20,7 @@ class CollectionCreate(BaseModel):
     embedding_dimensions: int = Field(default=384, gt=0)
     chunk_size: int = Field(default=512, gt=0)
     chunk_overlap: int = Field(default=50, ge=0)
-    visibility: str = Field(default="private")  # private, shared, public
+    visibility: Visibility = Field(default="private")
     config: dict[str, Any] | None = None
     extra_metadata: dict[str, Any] | None = None
 
@@ -28,12 +32,12 @@ class CollectionUpdate(BaseModel):
     description: str | None = None
     chunk_size: int | None = Field(None, gt=0)
     chunk_overlap: int | None = Field(None, ge=0)
-    visibility: str | None = None
+    visibility: Visibility | None = None
     config: dict[str, Any] | None = None
     extra_metadata: dict[str, Any] | None = None
 
 
-class CollectionResponse(BaseModel):
+class CollectionResponse(ORMResponseModel):
     """Collection response schema."""
 
     id: UUID
@@ -44,16 +48,14 @@ class CollectionResponse(BaseModel):
     embedding_dimensions: int
     chunk_size: int
     chunk_overlap: int
-    visibility: str
+    visibility: Visibility
     document_count: int
     chunk_count: int
-    config: dict[str, Any] | None
-    extra_metadata: dict[str, Any] | None
+    config: RawJSON | None
+    extra_metadata: RawJSON | None
     created_at: datetime
     updated_at: datetime
 
-    model_config = {"from_attributes": True}
-
 
 class CollectionListResponse(BaseModel):
     """Collection list response schema."""
@@ -71,7 +73,7 @@ class DocumentUpload(BaseModel):
     extra_metadata: dict[str, Any] | None = None
 
 
-class DocumentResponse(BaseModel):
+class DocumentResponse(ORMResponseModel):
     """Document response schema."""
 
     id: UUID
@@ -88,12 +90,10 @@ class DocumentResponse(BaseModel):
     total_tokens: int | None
     processed_at: datetime | None
     error_message: str | None
-    extra_metadata: dict[str, Any] | None
+    extra_metadata: RawJSON | None
     created_at: datetime
     updated_at: datetime
 
-    model_config = {"from_attributes": True}
-
 
 class DocumentListResponse(BaseModel):
     """Document list response schema."""
@@ -102,7 +102,7 @@ class DocumentListResponse(BaseModel):
     pagination: dict[str, Any]
 
 
-class ChunkResponse(BaseModel):
+class ChunkResponse(ORMResponseModel):
     """Chunk response schema."""
 
     id: UUID
@@ -114,11 +114,9 @@ class ChunkResponse(BaseModel):
     page_number: int | None
     section: str | None
     score: float | None = None  # similarity score when retrieved
-    extra_metadata: dict[str, Any] | None
+    extra_metadata: RawJSON | None
     created_at: datetime
 
-    model_config = {"from_attributes": True}
-
 
 class RAGQueryRequest(BaseModel):
     """RAG query request schema."""
@@ -131,7 +129,7 @@ class RAGQueryRequest(BaseModel):
     include_content: bool = Field(default=True)
 
 
-class RAGQueryResponse(BaseModel):
+class RAGQueryResponse(ORMResponseModel):
     """RAG query response schema."""
 
     query: str
@@ -140,8 +138,6 @@ class RAGQueryResponse(BaseModel):
     retrieval_time_ms: int | None
     collection_id: UUID | None = None
 
-    model_config = {"from_attributes": True}
-
 
 class RAGContextRequest(BaseModel):
     """RAG context retrieval for agent execution."""
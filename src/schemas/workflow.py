@@ -5,10 +5,19 @@ Schemas for workflow definitions, executions, tasks, and messages.
 """
 
 from datetime import datetime
-from typing import Any
+from typing import Any, Literal
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
+
+from src.schemas.base import ORMResponseModel, RawJSON
+
+# Fixed value sets, validated as literals so each value maps to one shared string
+StepType = Literal["agent", "mcp_tool", "parallel", "conditional", "http"]
+RetryStrategy = Literal["exponential", "linear", "none"]
+WorkflowStatus = Literal["draft", "active", "archived"]
+TaskType = Literal["execute", "delegate", "communicate"]
+MessageType = Literal["request", "response", "notification", "broadcast"]
 
 
 # ============================================================================
@@ -19,7 +28,9 @@ from pydantic import BaseModel, Field
 class WorkflowStepDefinition(BaseModel):
     """Workflow step definition."""
 
-    type: str = Field(..., description="Step type: agent, mcp_tool, parallel, conditional, http")
+    type: StepType = Field(
+        ..., description="Step type: agent, mcp_tool, parallel, conditional, http"
+    )
     name: str = Field(..., description="Step name")
     agent_id: str | None = Field(None, description="Agent ID (for agent steps)")
     server_id: str | None = Field(None, description="MCP server ID (for mcp_tool steps)")
@@ -57,11 +68,11 @@ class WorkflowCreate(BaseModel):
     name: str = Field(..., min_length=1, max_length=255, description="Workflow name")
     description: str | None = Field(None, max_length=1000, description="Workflow description")
     version: str = Field(default="1.0.0", description="Workflow version")
-    steps: list[WorkflowStepDefinition] = Field(..., min_items=1, description="Workflow steps")
+    steps: list[WorkflowStepDefinition] = Field(..., min_length=1, description="Workflow steps")
     triggers: list[WorkflowTrigger] | None = Field(None, description="Workflow triggers")
     timeout_seconds: int = Field(default=3600, ge=1, description="Workflow timeout in seconds")
     max_retries: int = Field(default=3, ge=0, le=10, description="Max retries")
-    retry_strategy: str = Field(
+    retry_strategy: RetryStrategy = Field(
         default="exponential", description="Retry strategy: exponential, linear, none"
     )
     tags: list[str] | None = Field(None, description="Workflow tags")
@@ -78,13 +89,15 @@ class WorkflowUpdate(BaseModel):
     triggers: list[WorkflowTrigger] | None = Field(None, description="Workflow triggers")
     timeout_seconds: int | None = Field(None, ge=1, description="Workflow timeout in seconds")
     max_retries: int | None = Field(None, ge=0, le=10, description="Max retries")
-    retry_strategy: str | None = Field(None, description="Retry strategy")
-    status: str | None = Field(None, description="Workflow status: draft, active, archived")
+    retry_strategy: RetryStrategy | None = Field(None, description="Retry strategy")
+    status: WorkflowStatus | None = Field(
+        None, description="Workflow status: draft, active, archived"
+    )
     tags: list[str] | None = Field(None, description="Workflow tags")
     category: str | None = Field(None, max_length=100, description="Workflow category")
 
 
-class WorkflowResponse(BaseModel):
+class WorkflowResponse(ORMResponseModel):
     """Workflow response."""
 
     id: UUID = Field(..., description="Workflow ID")
@@ -93,12 +106,12 @@ class WorkflowResponse(BaseModel):
     slug: str = Field(..., description="Workflow slug")
     description: str | None = Field(None, description="Workflow description")
     version: str = Field(..., description="Workflow version")
-    steps: list[dict[str, Any]] = Field(..., description="Workflow steps")
-    triggers: list[dict[str, Any]] | None = Field(None, description="Workflow triggers")
+    steps: list[RawJSON] = Field(..., description="Workflow steps")
+    triggers: list[RawJSON] | None = Field(None, description="Workflow triggers")
     timeout_seconds: int = Field(..., description="Workflow timeout in seconds")
     max_retries: int = Field(..., description="Max retries")
-    retry_strategy: str = Field(..., description="Retry strategy")
-    status: str = Field(..., description="Workflow status")
+    retry_strategy: RetryStrategy = Field(..., description="Retry strategy")
+    status: WorkflowStatus = Field(..., description="Workflow status")
     tags: list[str] | None = Field(None, description="Workflow tags")
     category: str | None = Field(None, description="Workflow category")
     execution_count: int = Field(..., description="Total execution count")
@@ -109,9 +122,6 @@ class WorkflowResponse(BaseModel):
     created_at: datetime = Field(..., description="Creation timestamp")
     updated_at: datetime = Field(..., description="Last update timestamp")
 
-    class Config:
-        from_attributes = True
-
 
 class WorkflowListResponse(BaseModel):
     """List workflows response."""
@@ -135,46 +145,42 @@ class WorkflowExecuteRequest(BaseModel):
     context: dict[str, Any] | None = Field(None, description="Execution context")
 
 
-class WorkflowStepExecutionResponse(BaseModel):
+class WorkflowStepExecutionResponse(ORMResponseModel):
     """Workflow step execution response."""
 
     id: UUID = Field(..., description="Step execution ID")
     workflow_execution_id: UUID = Field(..., description="Workflow execution ID")
     step_name: str = Field(..., description="Step name")
-    step_type: str = Field(..., description="Step type")
+    step_type: StepType = Field(..., description="Step type")
     agent_id: UUID | None = Field(None, description="Agent ID")
     status: str = Field(..., description="Step status")
-    input_data: dict[str, Any] | None = Field(None, description="Input data")
-    output_data: dict[str, Any] | None = Field(None, description="Output data")
+    input_data: RawJSON | None = Field(None, description="Input data")
+    output_data: RawJSON | None = Field(None, description="Output data")
     error_message: str | None = Field(None, description="Error message")
     retry_count: int = Field(..., description="Retry count")
     duration_seconds: int | None = Field(None, description="Duration in seconds")
     started_at: datetime | None = Field(None, description="Start timestamp")
     completed_at: datetime | None = Field(None, description="Completion timestamp")
 
-    class Config:
-        from_attributes = True
 
-
-class WorkflowExecutionResponse(BaseModel):
+class WorkflowExecutionResponse(ORMResponseModel):
     """Workflow execution response."""
 
     id: UUID = Field(..., description="Execution ID")
     tenant_id: UUID = Field(..., description="Tenant ID")
     workflow_id: UUID = Field(..., description="Workflow ID")
     status: str = Field(..., description="Execution status")
-    current_step: str = Field(..., description="Current step name")
-    input_data: dict[str, Any] | None = Field(None, description="Input data")
-    output_data: dict[str, Any] | None = Field(None, description="Output data")
-    context: dict[str, Any] | None = Field(None, description="Execution context")
+    current_step: str | None = Field(None, description="Current step name")
+    input_data: RawJSON | None = Field(None, description="Input data")
+    output_data: RawJSON | None = Field(None, description="Output data")
+    context: RawJSON | None = Field(None, description="Execution context")
     error_message: str | None = Field(None, description="Error message")
     duration_seconds: int | None = Field(None, description="Duration in seconds")
     started_at: datetime | None = Field(None, description="Start timestamp")
     completed_at: datetime | None = Field(None, description="Completion timestamp")
-    created_at: datetime = Field(..., description="Creation timestamp")
-
-    class Config:
-        from_attributes = True
+    created_at: datetime = Field(
+        ..., validation_alias="started_at", description="Creation timestamp"
+    )
 
 
 class WorkflowExecutionDetailResponse(WorkflowExecutionResponse):
@@ -203,7 +209,7 @@ class AgentTaskCreate(BaseModel):
     agent_id: UUID = Field(..., description="Agent ID")
     parent_task_id: UUID | None = Field(None, description="Parent task ID")
     workflow_execution_id: UUID | None = Field(None, description="Workflow execution ID")
-    task_type: str = Field(
+    task_type: TaskType = Field(
         default="execute", description="Task type: execute, delegate, communicate"
     )
     instruction: str = Field(..., min_length=1, description="Task instruction")
@@ -221,7 +227,7 @@ class AgentTaskUpdate(BaseModel):
     error_message: str | None = Field(None, description="Error message")
 
 
-class AgentTaskResponse(BaseModel):
+class AgentTaskResponse(ORMResponseModel):
     """Agent task response."""
 
     id: UUID = Field(..., description="Task ID")
@@ -229,12 +235,12 @@ class AgentTaskResponse(BaseModel):
     agent_id: UUID = Field(..., description="Agent ID")
     parent_task_id: UUID | None = Field(None, description="Parent task ID")
     workflow_execution_id: UUID | None = Field(None, description="Workflow execution ID")
-    task_type: str = Field(..., description="Task type")
+    task_type: TaskType = Field(..., description="Task type")
     instruction: str = Field(..., description="Task instruction")
-    context: dict[str, Any] | None = Field(None, description="Task context")
+    context: RawJSON | None = Field(None, description="Task context")
     status: str = Field(..., description="Task status")
     priority: int = Field(..., description="Task priority")
-    result: dict[str, Any] | None = Field(None, description="Task result")
+    result: RawJSON | None = Field(None, description="Task result")
     error_message: str | None = Field(None, description="Error message")
     assigned_at: datetime | None = Field(None, description="Assignment timestamp")
     started_at: datetime | None = Field(None, description="Start timestamp")
@@ -242,9 +248,6 @@ class AgentTaskResponse(BaseModel):
     due_at: datetime | None = Field(None, description="Due date")
     created_at: datetime = Field(..., description="Creation timestamp")
 
-    class Config:
-        from_attributes = True
-
 
 class AgentTaskListResponse(BaseModel):
     """List agent tasks response."""
@@ -266,7 +269,7 @@ class AgentMessageCreate(BaseModel):
     from_agent_id: UUID = Field(..., description="Sender agent ID")
     to_agent_id: UUID = Field(..., description="Recipient agent ID")
     workflow_execution_id: UUID | None = Field(None, description="Workflow execution ID")
-    message_type: str = Field(
+    message_type: MessageType = Field(
         default="request", description="Message type: request, response, notification, broadcast"
     )
     content: str = Field(..., min_length=1, description="Message content")
@@ -281,7 +284,7 @@ class AgentMessageUpdate(BaseModel):
     status: str | None = Field(None, description="Message status")
 
 
-class AgentMessageResponse(BaseModel):
+class AgentMessageResponse(ORMResponseModel):
     """Agent message response."""
 
     id: UUID = Field(..., description="Message ID")
@@ -289,19 +292,18 @@ class AgentMessageResponse(BaseModel):
     from_agent_id: UUID = Field(..., description="Sender agent ID")
     to_agent_id: UUID = Field(..., description="Recipient agent ID")
     workflow_execution_id: UUID | None = Field(None, description="Workflow execution ID")
-    message_type: str = Field(..., description="Message type")
+    message_type: MessageType = Field(..., description="Message type")
     content: str = Field(..., description="Message content")
-    data: dict[str, Any] | None = Field(None, description="Message data")
+    data: RawJSON | None = Field(None, description="Message data")
     status: str = Field(..., description="Message status")
     requires_response: bool = Field(..., description="Requires response")
-    response_id: UUID | None = Field(None, description="Response to message ID")
+    response_id: UUID | None = Field(
+        None, validation_alias="in_response_to", description="Response to message ID"
+    )
     sent_at: datetime | None = Field(None, description="Sent timestamp")
     delivered_at: datetime | None = Field(None, description="Delivered timestamp")
     read_at: datetime | None = Field(None, description="Read timestamp")
-    created_at: datetime = Field(..., description="Creation timestamp")
-
-    class Config:
-        from_attributes = True
+    created_at: datetime = Field(..., validation_alias="sent_at", description="Creation timestamp")
 
 
 class AgentMessageListResponse(BaseModel):
@@ -311,3 +313,8 @@ class AgentMessageListResponse(BaseModel):
     total: int = Field(..., description="Total count")
     offset: int = Field(..., description="Offset")
     limit: int = Field(..., description="Limit")
+
+
+# Batch serializers for the step/trigger lists stored on a workflow
+STEP_LIST_ADAPTER = TypeAdapter(list[WorkflowStepDefinition])
+TRIGGER_LIST_ADAPTER = TypeAdapter(list[WorkflowTrigger])
@@ -1,10 +1,12 @@
 """Agent execution service."""
 
 import time
-from datetime import datetime
+import uuid
+from collections import OrderedDict
+from datetime import datetime, timezone
 from typing import Any
 
-from anthropic import Anthropic
+from anthropic import AsyncAnthropic
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -12,6 +14,13 @@ from src.core.config import settings
 from src.db.models import Agent, Conversation, Message
 from src.schemas.agent import AgentExecuteResponse, TokenUsage
 
+# Per-process conversation history: conversation_id -> (last sequence_number, messages).
+# Only messages after the last known sequence number are fetched on each turn.
+_HISTORY_CACHE: OrderedDict[uuid.UUID, tuple[int, list[dict[str, Any]]]] = OrderedDict()
+_HISTORY_CACHE_MAX_CONVERSATIONS = 1024
+
+_UTC = timezone.utc
+
 
 class AgentExecutor:
     """Executes agents with LLM integration."""
@@ -25,7 +34,7 @@ class AgentExecutor:
         if agent.model_provider == "anthropic":
             if not settings.ANTHROPIC_API_KEY:
                 raise ValueError("ANTHROPIC_API_KEY not configured")
-            self.client = Anthropic(api_key=settings.ANTHROPIC_API_KEY)
+            self.client = AsyncAnthropic(api_key=settings.ANTHROPIC_API_KEY)
         elif agent.model_provider == "openai":
             if not settings.OPENAI_API_KEY:
                 raise ValueError("OPENAI_API_KEY not configured")
@@ -41,13 +50,13 @@ class AgentExecutor:
         max_iterations: int | None = None,
     ) -> AgentExecuteResponse:
         """Execute agent with given input."""
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
 
         # Get conversation history
         conversation_history = await self._get_conversation_history(conversation.id)
 
-        # Add user message to conversation
-        user_message = await self._save_message(
+        # Add user message to conversation (written together with the reply below)
+        user_message = self._save_message(
             conversation=conversation,
             role="user",
             content=input_text,
@@ -61,10 +70,10 @@ class AgentExecutor:
             raise NotImplementedError(f"Provider {self.agent.model_provider} not implemented")
 
         # Calculate latency
-        latency_ms = int((time.time() - start_time) * 1000)
+        latency_ms = (time.monotonic_ns() - start_ns) // 1_000_000
 
         # Save assistant message
-        assistant_message = await self._save_message(
+        assistant_message = self._save_message(
             conversation=conversation,
             role="assistant",
             content=response["content"],
@@ -75,11 +84,13 @@ class AgentExecutor:
             latency_ms=latency_ms,
         )
 
-        # Update conversation status
+        # Update conversation status - one commit writes both messages and the status
         conversation.status = "completed"
-        conversation.completed_at = datetime.utcnow()
+        conversation.completed_at = datetime.now(_UTC)
         await self.db.commit()
 
+        self._remember_messages(conversation.id, [user_message, assistant_message])
+
         return AgentExecuteResponse(
             conversation_id=conversation.id,
             message_id=assistant_message.id,
@@ -105,21 +116,22 @@ class AgentExecutor:
         # Add current user message
         messages.append({"role": "user", "content": input_text})
 
-        # Call Claude API
-        response = self.client.messages.create(
+        # Call Claude API - streamed on the async client so the event loop keeps
+        # serving other requests while the reply is generated
+        text_parts = []
+        async with self.client.messages.stream(
             model=self.agent.model_name,
             max_tokens=self.agent.max_tokens or 4096,
             temperature=self.agent.temperature or 0.7,
             system=self.agent.system_prompt or "You are a helpful AI assistant.",
             messages=messages,
-        )
+        ) as stream:
+            async for text in stream.text_stream:
+                text_parts.append(text)
+            response = await stream.get_final_message()
 
         # Extract content
-        content = ""
-        if response.content:
-            for block in response.content:
-                if hasattr(block, "text"):
-                    content += block.text
+        content = "".join(text_parts)
 
         return {
             "content": content,
@@ -132,24 +144,62 @@ class AgentExecutor:
         }
 
     async def _get_conversation_history(self, conversation_id: Any) -> list[dict[str, Any]]:
-        """Get conversation history."""
+        """Get conversation history.
+
+        Messages already cached for the conversation are reused; only ones written
+        since (e.g. by another worker) are selected.
+        """
+        last_sequence, history = _HISTORY_CACHE.get(conversation_id, (-1, []))
+
         result = await self.db.execute(
             select(Message)
-            .where(Message.conversation_id == conversation_id)
+            .where(
+                Message.conversation_id == conversation_id,
+                Message.sequence_number > last_sequence,
+            )
             .order_by(Message.sequence_number)
         )
         messages = result.scalars().all()
 
-        return [
-            {
-                "role": msg.role,
-                "content": msg.content,
-                "tool_calls": msg.tool_calls,
-            }
-            for msg in messages
-        ]
+        if messages:
+            last_sequence = messages[-1].sequence_number
+            history = history + [
+                {
+                    "role": msg.role,
+                    "content": msg.content,
+                    "tool_calls": msg.tool_calls,
+                }
+                for msg in messages
+            ]
+
+        _HISTORY_CACHE[conversation_id] = (last_sequence, history)
+        _HISTORY_CACHE.move_to_end(conversation_id)
+        if len(_HISTORY_CACHE) > _HISTORY_CACHE_MAX_CONVERSATIONS:
+            _HISTORY_CACHE.popitem(last=False)
+
+        return history
+
+    def _remember_messages(self, conversation_id: Any, messages: list[Message]) -> None:
+        """Append committed messages to the conversation's cached history."""
+        cached = _HISTORY_CACHE.get(conversation_id)
+        if cached is None:
+            return
+
+        last_sequence, history = cached
+        new_messages = [msg for msg in messages if msg.sequence_number > last_sequence]
+        if not new_messages:
+            return
+
+        _HISTORY_CACHE[conversation_id] = (
+            new_messages[-1].sequence_number,
+            history
+            + [
+                {"role": msg.role, "content": msg.content, "tool_calls": msg.tool_calls}
+                for msg in new_messages
+            ],
+        )
 
-    async def _save_message(
+    def _save_message(
         self,
         conversation: Conversation,
         role: str,
@@ -160,8 +210,13 @@ class AgentExecutor:
         tool_calls: list[dict[str, Any]] | None = None,
         latency_ms: int | None = None,
     ) -> Message:
-        """Save message to database."""
+        """Add a message to the session; the caller commits.
+
+        The id and created_at are set client-side so the message is usable without
+        a refresh after the commit.
+        """
         message = Message(
+            id=uuid.uuid4(),
             tenant_id=conversation.tenant_id,
             conversation_id=conversation.id,
             role=role,
@@ -171,8 +226,7 @@ class AgentExecutor:
             token_count=token_count,
             tool_calls=tool_calls,
             latency_ms=latency_ms,
+            created_at=datetime.now(_UTC),
         )
         self.db.add(message)
-        await self.db.commit()
-        await self.db.refresh(message)
         return message
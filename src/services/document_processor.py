@@ -1,17 +1,164 @@
 """Document processing service for RAG."""
 
+import asyncio
 import hashlib
+import multiprocessing
+import os
 import re
+import zipfile
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
 from io import BytesIO
 from typing import Any
 
 import aiofiles
 import tiktoken
-from bs4 import BeautifulSoup
-from docx import Document as DocxDocument
+from lxml import etree
+from lxml import html as lxml_html
 from markdown import markdown
 from pypdf import PdfReader
 
+# Text extraction is CPU-bound, so large uploads are handled in worker processes:
+# PDFs split into one contiguous page range per worker (each range at least
+# _PDF_MIN_PAGES_PER_TASK pages), HTML/Markdown above a size threshold
+_PDF_MIN_PAGES_PER_TASK = 8
+_PROCESS_POOL_MIN_BYTES = 256 * 1024
+_EXTRACTION_MAX_WORKERS = min(os.cpu_count() or 1, 4)
+
+_extraction_executor: ProcessPoolExecutor | None = None
+
+# Text cleanup: any run of whitespace, newlines included, becomes one space
+_WHITESPACE_RUN_RE = re.compile(r"\s+")
+
+# End of a sentence, used to trim chunks at a sentence boundary
+_SENTENCE_END_RE = re.compile(r"[.!?]\s+")
+
+# File extension -> content type understood by process_file
+_CONTENT_TYPE_MAP = {
+    "pdf": "pdf",
+    "docx": "docx",
+    "doc": "docx",
+    "txt": "txt",
+    "md": "md",
+    "markdown": "md",
+    "html": "html",
+    "htm": "html",
+    "json": "json",
+    "csv": "csv",
+}
+
+# WordprocessingML elements read from a DOCX body
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_W_BODY = f"{_W}body"
+_W_P = f"{_W}p"
+_W_R = f"{_W}r"
+_W_HYPERLINK = f"{_W}hyperlink"
+_W_T = f"{_W}t"
+_W_BR = f"{_W}br"
+_W_TYPE = f"{_W}type"
+# Run children other than w:t/w:br with a fixed text equivalent
+_W_RUN_TEXT = {
+    f"{_W}tab": "\t",
+    f"{_W}ptab": "\t",
+    f"{_W}cr": "\n",
+    f"{_W}noBreakHyphen": "-",
+}
+
+# Uploaded HTML is read as UTF-8 regardless of any declared encoding, as before
+_HTML_PARSER = lxml_html.HTMLParser(encoding="utf-8")
+
+
+def _get_extraction_executor() -> ProcessPoolExecutor:
+    """Get the process pool shared by all text extractions."""
+    global _extraction_executor
+
+    if _extraction_executor is None:
+        # spawn rather than fork: the parent runs an event loop and other threads
+        _extraction_executor = ProcessPoolExecutor(
+            max_workers=_EXTRACTION_MAX_WORKERS, mp_context=multiprocessing.get_context("spawn")
+        )
+
+    return _extraction_executor
+
+
+def _pdf_page_count(file_content: bytes) -> int:
+    """Count the pages of a PDF."""
+    return len(PdfReader(BytesIO(file_content)).pages)
+
+
+def _extract_pdf_pages(file_content: bytes, first_page: int, last_page: int) -> list[str]:
+    """Extract the text of pages [first_page, last_page) of a PDF.
+
+    Module-level so it can run in a worker process; pypdf readers can't be
+    pickled, so each call opens its own.
+    """
+    pdf = PdfReader(BytesIO(file_content))
+    return [pdf.pages[index].extract_text() for index in range(first_page, last_page)]
+
+
+def _html_to_text(html: str | bytes) -> str:
+    """Get the text content of an HTML document, without scripts and styles."""
+    try:
+        root = lxml_html.document_fromstring(html, parser=_HTML_PARSER)
+    except etree.ParserError:
+        # Nothing but whitespace or comments
+        return ""
+
+    # Remove script and style elements (keeping the text that follows them)
+    etree.strip_elements(root, "script", "style", with_tail=False)
+
+    return root.text_content()
+
+
+def _docx_paragraph_text(paragraph: etree._Element) -> str:
+    """Get a paragraph's text from its runs, including runs inside hyperlinks."""
+    parts = []
+    for child in paragraph.iterchildren(_W_R, _W_HYPERLINK):
+        runs = (child,) if child.tag == _W_R else child.iterchildren(_W_R)
+        for run in runs:
+            for element in run.iterchildren():
+                if element.tag == _W_T:
+                    parts.append(element.text or "")
+                elif element.tag == _W_BR:
+                    # Page and column breaks carry no text
+                    if element.get(_W_TYPE, "textWrapping") == "textWrapping":
+                        parts.append("\n")
+                elif element.tag in _W_RUN_TEXT:
+                    parts.append(_W_RUN_TEXT[element.tag])
+    return "".join(parts)
+
+
+def _docx_to_text(file_content: bytes) -> str:
+    """Get the text of a DOCX's top-level body paragraphs.
+
+    Streams word/document.xml instead of building python-docx's object model;
+    each paragraph is dropped once read, so memory stays bounded.
+    """
+    text_parts = []
+    with zipfile.ZipFile(BytesIO(file_content)) as archive:
+        with archive.open("word/document.xml") as document_xml:
+            for _, paragraph in etree.iterparse(document_xml, tag=_W_P):
+                parent = paragraph.getparent()
+                if parent is None or parent.tag != _W_BODY:
+                    # Table cell or text box paragraph, skipped like python-docx does
+                    continue
+
+                paragraph_text = _docx_paragraph_text(paragraph)
+                if paragraph_text.strip():
+                    text_parts.append(paragraph_text)
+
+                # Free this paragraph and the body elements before it
+                paragraph.clear()
+                while paragraph.getprevious() is not None:
+                    del parent[0]
+
+    return "\n\n".join(text_parts)
+
+
+def _markdown_to_text(file_content: bytes) -> str:
+    """Get the text of a Markdown document by rendering it to HTML."""
+    return _html_to_text(markdown(file_content.decode("utf-8", errors="ignore")))
+
 
 class DocumentProcessor:
     """Process documents into chunks for RAG."""
@@ -64,111 +211,116 @@ class DocumentProcessor:
         return text, chunks
 
     async def _extract_pdf(self, file_content: bytes) -> str:
-        """Extract text from PDF."""
-        text_parts = []
-        pdf = PdfReader(BytesIO(file_content))
+        """Extract text from PDF.
+
+        Extraction runs off the event loop: in a thread for short PDFs, and split
+        into contiguous page ranges across the shared process pool for longer
+        ones. There is at most one range per worker, so the file is sent to and
+        parsed by each worker only once.
+        """
+        page_count = await asyncio.to_thread(_pdf_page_count, file_content)
 
-        for page_num, page in enumerate(pdf.pages, start=1):
-            page_text = page.extract_text()
-            if page_text:
-                text_parts.append(f"\n--- Page {page_num} ---\n{page_text}")
+        if page_count <= _PDF_MIN_PAGES_PER_TASK:
+            page_texts = await asyncio.to_thread(
+                _extract_pdf_pages, file_content, 0, page_count
+            )
+        else:
+            task_count = min(_EXTRACTION_MAX_WORKERS, page_count // _PDF_MIN_PAGES_PER_TASK)
+            bounds = [page_count * task // task_count for task in range(task_count + 1)]
+
+            loop = asyncio.get_running_loop()
+            executor = _get_extraction_executor()
+            batches = await asyncio.gather(
+                *[
+                    loop.run_in_executor(
+                        executor, _extract_pdf_pages, file_content, first_page, last_page
+                    )
+                    for first_page, last_page in zip(bounds, bounds[1:])
+                ]
+            )
+            page_texts = [text for batch in batches for text in batch]
+
+        text_parts = [
+            f"\n--- Page {page_num} ---\n{page_text}"
+            for page_num, page_text in enumerate(page_texts, start=1)
+            if page_text
+        ]
 
         return "\n".join(text_parts)
 
     async def _extract_docx(self, file_content: bytes) -> str:
         """Extract text from DOCX."""
-        doc = DocxDocument(BytesIO(file_content))
-        text_parts = []
-
-        for paragraph in doc.paragraphs:
-            if paragraph.text.strip():
-                text_parts.append(paragraph.text)
-
-        return "\n\n".join(text_parts)
+        return await self._convert_off_loop(_docx_to_text, file_content)
 
     async def _extract_markdown(self, file_content: bytes) -> str:
         """Extract text from Markdown by converting to HTML then extracting text."""
-        md_text = file_content.decode("utf-8", errors="ignore")
-        html = markdown(md_text)
-        return await self._extract_html(html.encode("utf-8"))
+        return await self._convert_off_loop(_markdown_to_text, file_content)
 
     async def _extract_html(self, file_content: bytes) -> str:
         """Extract text from HTML."""
-        html = file_content.decode("utf-8", errors="ignore")
-        soup = BeautifulSoup(html, "html.parser")
+        return await self._convert_off_loop(_html_to_text, file_content)
 
-        # Remove script and style elements
-        for script in soup(["script", "style"]):
-            script.decompose()
+    @staticmethod
+    async def _convert_off_loop(convert: Callable[[bytes], str], file_content: bytes) -> str:
+        """Run a text conversion in a thread, or in the process pool for large files."""
+        if len(file_content) < _PROCESS_POOL_MIN_BYTES:
+            return await asyncio.to_thread(convert, file_content)
 
-        # Get text
-        text = soup.get_text()
-        return text
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_extraction_executor(), convert, file_content)
 
     def _clean_text(self, text: str) -> str:
-        """Clean and normalize text."""
-        # Remove excessive whitespace
-        text = re.sub(r"\s+", " ", text)
-
-        # Remove excessive newlines
-        text = re.sub(r"\n{3,}", "\n\n", text)
-
-        # Strip leading/trailing whitespace
-        text = text.strip()
-
-        return text
+        """Clean and normalize text by collapsing every whitespace run to one space."""
+        return _WHITESPACE_RUN_RE.sub(" ", text).strip()
 
-    def _create_chunks(self, text: str) -> list[dict[str, Any]]:
+    def _create_chunks(
+        self, text: str, tokens: list[int] | None = None
+    ) -> list[dict[str, Any]]:
         """Create overlapping chunks from text.
 
         Args:
             text: Full text to chunk
+            tokens: Tokens of text, if the caller already has them
 
         Returns:
             List of chunk dictionaries with content, tokens, and metadata
         """
         # Tokenize the full text
-        tokens = self.tokenizer.encode(text)
+        if tokens is None:
+            tokens = self.tokenizer.encode(text)
         total_tokens = len(tokens)
 
-        chunks = []
-        start = 0
-        sequence = 0
-
-        while start < total_tokens:
-            # Get chunk tokens
-            end = min(start + self.chunk_size, total_tokens)
-            chunk_tokens = tokens[start:end]
+        # Token windows, advancing by chunk_size - chunk_overlap, decoded in one batch
+        windows = [
+            (start, min(start + self.chunk_size, total_tokens))
+            for start in range(0, total_tokens, self.chunk_size - self.chunk_overlap)
+        ]
+        window_texts = self.tokenizer.decode_batch([tokens[start:end] for start, end in windows])
 
-            # Decode back to text
-            chunk_text = self.tokenizer.decode(chunk_tokens)
+        chunks = []
+        for sequence, ((start, end), chunk_text) in enumerate(zip(windows, window_texts)):
+            token_count = end - start
 
             # Try to find sentence boundaries for cleaner chunks
             if end < total_tokens:  # Not the last chunk
                 # Look for sentence endings in the last 20% of the chunk
                 search_start = int(len(chunk_text) * 0.8)
-                sentence_match = re.search(
-                    r"[.!?]\s+", chunk_text[search_start:]
-                )
+                sentence_match = _SENTENCE_END_RE.search(chunk_text, search_start)
                 if sentence_match:
                     # Split at sentence boundary
-                    split_pos = search_start + sentence_match.end()
+                    split_pos = sentence_match.end()
                     chunk_text = chunk_text[:split_pos].strip()
                     # Recalculate actual tokens used
-                    chunk_tokens = self.tokenizer.encode(chunk_text)
+                    token_count = len(self.tokenizer.encode_ordinary(chunk_text))
 
             chunks.append({
                 "content": chunk_text.strip(),
                 "sequence_number": sequence,
-                "token_count": len(chunk_tokens),
+                "token_count": token_count,
                 "start_char": start,
                 "end_char": start + len(chunk_text),
             })
 
-            # Move to next chunk with overlap
-            start += self.chunk_size - self.chunk_overlap
-            sequence += 1
-
         return chunks
 
     @staticmethod
@@ -193,22 +345,11 @@ class DocumentProcessor:
         Returns:
             Content type string
         """
-        ext = filename.lower().split(".")[-1] if "." in filename else "txt"
+        _, dot, ext = filename.rpartition(".")
+        if not dot:
+            return "txt"
 
-        content_type_map = {
-            "pdf": "pdf",
-            "docx": "docx",
-            "doc": "docx",
-            "txt": "txt",
-            "md": "md",
-            "markdown": "md",
-            "html": "html",
-            "htm": "html",
-            "json": "json",
-            "csv": "csv",
-        }
-
-        return content_type_map.get(ext, "txt")
+        return _CONTENT_TYPE_MAP.get(ext.lower(), "txt")
 
 
 class ChunkingStrategy:
@@ -216,30 +357,35 @@ class ChunkingStrategy:
 
     @staticmethod
     def fixed_size_chunking(
-        text: str, chunk_size: int, overlap: int, tokenizer: Any
+        text: str,
+        chunk_size: int,
+        overlap: int,
+        tokenizer: Any,
+        tokens: list[int] | None = None,
     ) -> list[dict[str, Any]]:
-        """Fixed-size chunking with overlap (default strategy)."""
+        """Fixed-size chunking with overlap (default strategy).
+
+        Pass tokens to reuse an existing tokenization of text, e.g. when trying
+        several chunk sizes on one document.
+        """
         processor = DocumentProcessor(chunk_size=chunk_size, chunk_overlap=overlap)
-        return processor._create_chunks(text)
+        return processor._create_chunks(text, tokens)
 
     @staticmethod
     def semantic_chunking(text: str, max_chunk_size: int = 512) -> list[dict[str, Any]]:
         """Chunk by paragraphs and sections, respecting semantic boundaries."""
         chunks = []
-        paragraphs = text.split("\n\n")
+        paragraphs = [para.strip() for para in text.split("\n\n") if para.strip()]
         tokenizer = tiktoken.get_encoding("cl100k_base")
 
+        # Count every paragraph's tokens in one batched call
+        paragraph_tokens = [len(tokens) for tokens in tokenizer.encode_batch(paragraphs)]
+
         current_chunk = []
         current_tokens = 0
         sequence = 0
 
-        for para in paragraphs:
-            para = para.strip()
-            if not para:
-                continue
-
-            para_tokens = len(tokenizer.encode(para))
-
+        for para, para_tokens in zip(paragraphs, paragraph_tokens):
             if current_tokens + para_tokens <= max_chunk_size:
                 current_chunk.append(para)
                 current_tokens += para_tokens
@@ -278,18 +424,21 @@ class ChunkingStrategy:
         """Chunk by sentences."""
         # Simple sentence splitting
         sentences = re.split(r"(?<=[.!?])\s+", text)
-        chunks = []
         tokenizer = tiktoken.get_encoding("cl100k_base")
 
-        for i in range(0, len(sentences), sentences_per_chunk):
-            chunk_sentences = sentences[i:i + sentences_per_chunk]
-            chunk_text = " ".join(chunk_sentences)
-            chunks.append({
+        chunk_texts = [
+            " ".join(sentences[i:i + sentences_per_chunk])
+            for i in range(0, len(sentences), sentences_per_chunk)
+        ]
+        chunk_tokens = tokenizer.encode_batch(chunk_texts)
+
+        return [
+            {
                 "content": chunk_text,
-                "sequence_number": i // sentences_per_chunk,
-                "token_count": len(tokenizer.encode(chunk_text)),
+                "sequence_number": sequence,
+                "token_count": len(tokens),
                 "start_char": 0,
                 "end_char": len(chunk_text),
-            })
-
-        return chunks
+            }
+            for sequence, (chunk_text, tokens) in enumerate(zip(chunk_texts, chunk_tokens))
+        ]
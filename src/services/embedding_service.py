@@ -1,10 +1,43 @@
 """Embedding service for generating vector embeddings."""
 
 import asyncio
+import hashlib
 from typing import Any
 
+import numpy as np
+import orjson
+
 from src.core.config import settings
 
+# Cached embeddings are stored as a format byte followed by the packed vector when
+# the Redis client returns bytes. Clients that decode responses to str store JSON
+# arrays, the format used before packed vectors, which both kinds of client read.
+_CACHE_FORMAT_FLOAT32 = b"\x01"
+_CACHE_FORMAT_JSON = b"["
+
+
+def _pack_embedding(embedding: list[float], binary: bool = True) -> bytes | str:
+    """Serialize an embedding for the Redis cache."""
+    if not binary:
+        return orjson.dumps(embedding).decode()
+    return _CACHE_FORMAT_FLOAT32 + np.asarray(embedding, dtype="<f4").tobytes()
+
+
+def _unpack_embedding(value: bytes | str | None) -> list[float] | None:
+    """Deserialize a cached embedding, or None if it is missing or in an unknown format."""
+    if not value:
+        return None
+
+    if isinstance(value, str):
+        return orjson.loads(value) if value[0] == "[" else None
+
+    cache_format = value[:1]
+    if cache_format == _CACHE_FORMAT_FLOAT32:
+        return np.frombuffer(value, dtype="<f4", offset=1).tolist()
+    if cache_format == _CACHE_FORMAT_JSON:
+        return orjson.loads(value)
+    return None
+
 
 class EmbeddingService:
     """Service for generating text embeddings.
@@ -23,19 +56,37 @@ class EmbeddingService:
         self.model = model
         self.provider = provider
         self.batch_size = 100 if provider == "openai" else 32  # Smaller batches for local
+        # Local tokenizers (WordPiece/SentencePiece) already collapse whitespace, so
+        # texts are only normalized for the OpenAI API, where whitespace is billed
+        self._pre_normalize = provider == "openai"
 
         if provider == "local":
+            import torch
             from sentence_transformers import SentenceTransformer
+            self._inference_mode = torch.inference_mode
             self._local_model = SentenceTransformer(model)
             self._local_model.eval()  # Set to evaluation mode
+            # Half precision halves weight and activation traffic on GPU; CPUs stay
+            # on float32, where fp16/bf16 matmuls are usually slower
+            if self._local_model.device.type == "cuda":
+                self._local_model.half()
         elif provider == "openai":
             if not settings.OPENAI_API_KEY:
                 raise ValueError("OPENAI_API_KEY is required for OpenAI embeddings")
             from openai import AsyncOpenAI
-            self.client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+            # The SDK retries 429s and 5xx responses with exponential backoff,
+            # honouring Retry-After
+            self.client = AsyncOpenAI(
+                api_key=settings.OPENAI_API_KEY, max_retries=settings.OPENAI_MAX_RETRIES
+            )
         else:
             raise ValueError(f"Unknown provider: {provider}")
 
+    def _encode_local(self, sentences: str | list[str], **kwargs: Any) -> Any:
+        """Run the local model with autograd tracking fully disabled."""
+        with self._inference_mode():
+            return self._local_model.encode(sentences, **kwargs)
+
     async def generate_embedding(self, text: str) -> list[float]:
         """Generate embedding for a single text.
 
@@ -46,14 +97,15 @@ class EmbeddingService:
             Embedding vector as list of floats
         """
         # Clean text - remove excessive whitespace and newlines
-        text = " ".join(text.split())
+        if self._pre_normalize:
+            text = " ".join(text.split())
 
         if self.provider == "local":
             # Run in thread pool to avoid blocking
             embedding = await asyncio.to_thread(
-                self._local_model.encode,
+                self._encode_local,
                 text,
-                convert_to_numpy=False,
+                convert_to_numpy=True,
                 show_progress_bar=False,
             )
             return embedding.tolist()
@@ -84,8 +136,19 @@ class EmbeddingService:
             return []
 
         # Clean texts
-        texts = [" ".join(text.split()) for text in texts]
+        if self._pre_normalize:
+            texts = [" ".join(text.split()) for text in texts]
+
+        # Embed each distinct text once, then fan the results back out
+        unique_texts = list(dict.fromkeys(texts))
+        if len(unique_texts) < len(texts):
+            embeddings_by_text = dict(zip(unique_texts, await self._embed_batch(unique_texts)))
+            return [embeddings_by_text[text] for text in texts]
 
+        return await self._embed_batch(texts)
+
+    async def _embed_batch(self, texts: list[str]) -> list[list[float]]:
+        """Embed cleaned texts with the configured provider, in batches."""
         if self.provider == "local":
             # Process in batches to manage memory
             all_embeddings = []
@@ -94,42 +157,39 @@ class EmbeddingService:
 
                 # Run in thread pool
                 embeddings = await asyncio.to_thread(
-                    self._local_model.encode,
+                    self._encode_local,
                     batch,
-                    convert_to_numpy=False,
+                    convert_to_numpy=True,
                     show_progress_bar=False,
                     batch_size=self.batch_size,
                 )
 
-                # Convert to list of lists
-                all_embeddings.extend([emb.tolist() for emb in embeddings])
+                # Convert the whole (batch, dims) array to lists in one call
+                all_embeddings.extend(embeddings.tolist())
 
             return all_embeddings
 
         elif self.provider == "openai":
-            embeddings = []
-
-            # Process in batches
-            for i in range(0, len(texts), self.batch_size):
-                batch = texts[i:i + self.batch_size]
-
-                # Truncate texts
-                batch = [text[:8000] for text in batch]
-
-                response = await self.client.embeddings.create(
-                    model=self.model,
-                    input=batch,
-                )
+            semaphore = asyncio.Semaphore(settings.OPENAI_EMBED_CONCURRENCY)
 
+            async def embed_batch(batch: list[str]) -> list[list[float]]:
+                async with semaphore:
+                    response = await self.client.embeddings.create(
+                        model=self.model,
+                        input=batch,
+                    )
                 # Extract embeddings in order
-                batch_embeddings = [item.embedding for item in response.data]
-                embeddings.extend(batch_embeddings)
-
-                # Small delay to avoid rate limiting
-                if i + self.batch_size < len(texts):
-                    await asyncio.sleep(0.1)
+                return [item.embedding for item in response.data]
+
+            # Process in batches concurrently; gather keeps them in input order
+            batch_results = await asyncio.gather(
+                *[
+                    embed_batch([text[:8000] for text in texts[i:i + self.batch_size]])
+                    for i in range(0, len(texts), self.batch_size)
+                ]
+            )
 
-            return embeddings
+            return [embedding for batch in batch_results for embedding in batch]
 
     async def generate_query_embedding(self, query: str) -> list[float]:
         """Generate embedding for a search query.
@@ -184,11 +244,23 @@ class CachedEmbeddingService(EmbeddingService):
         Args:
             model: Model name
             provider: "local" or "openai"
-            redis_client: Redis client for caching (optional)
+            redis_client: Redis client for caching (optional). Use
+                src.core.cache.get_binary_redis() for compact packed vectors; a
+                client with decode_responses=True falls back to JSON values.
         """
         super().__init__(model, provider)
         self.redis_client = redis_client
         self.cache_ttl = 86400 * 7  # 7 days
+        # Packed vectors aren't valid UTF-8, so a decoding client gets JSON instead
+        self._binary_cache = not (
+            redis_client is not None
+            and redis_client.connection_pool.connection_kwargs.get("decode_responses", False)
+        )
+
+    def _cache_key(self, text: str) -> str:
+        """Build the Redis key for a text's embedding."""
+        text_hash = hashlib.sha256(text.encode()).hexdigest()
+        return f"embedding:{self.provider}:{self.model}:{text_hash}"
 
     async def generate_embedding(self, text: str) -> list[float]:
         """Generate embedding with caching.
@@ -202,17 +274,13 @@ class CachedEmbeddingService(EmbeddingService):
         if not self.redis_client:
             return await super().generate_embedding(text)
 
-        # Create cache key
-        import hashlib
-        text_hash = hashlib.sha256(text.encode()).hexdigest()
-        cache_key = f"embedding:{self.provider}:{self.model}:{text_hash}"
+        cache_key = self._cache_key(text)
 
         # Try to get from cache
         try:
-            import json
-            cached = await self.redis_client.get(cache_key)
-            if cached:
-                return json.loads(cached)
+            cached = _unpack_embedding(await self.redis_client.get(cache_key))
+            if cached is not None:
+                return cached
         except Exception:
             # If cache fails, continue to generate
             pass
@@ -222,11 +290,10 @@ class CachedEmbeddingService(EmbeddingService):
 
         # Store in cache
         try:
-            import json
             await self.redis_client.setex(
                 cache_key,
                 self.cache_ttl,
-                json.dumps(embedding)
+                _pack_embedding(embedding, self._binary_cache)
             )
         except Exception:
             # Cache write failure is non-critical
@@ -245,55 +312,49 @@ class CachedEmbeddingService(EmbeddingService):
         Returns:
             List of embedding vectors
         """
-        if not self.redis_client:
+        if not self.redis_client or not texts:
             return await super().generate_embeddings_batch(texts)
 
-        import hashlib
-        import json
+        # Look up and generate each distinct text once
+        unique_texts = list(dict.fromkeys(texts))
+
+        # Hash each text once; the keys are reused when caching new embeddings
+        cache_keys = [self._cache_key(text) for text in unique_texts]
 
-        embeddings = []
-        texts_to_generate = []
-        text_indices = []
+        # Check the cache for every text in one round trip
+        try:
+            cached_values = await self.redis_client.mget(cache_keys)
+            embeddings: list[list[float] | None] = [
+                _unpack_embedding(cached) for cached in cached_values
+            ]
+        except Exception:
+            # If cache fails, generate everything
+            embeddings = [None] * len(unique_texts)
 
-        # Check cache for each text
-        for idx, text in enumerate(texts):
-            text_hash = hashlib.sha256(text.encode()).hexdigest()
-            cache_key = f"embedding:{self.provider}:{self.model}:{text_hash}"
+        # Generate missing embeddings
+        missing = [idx for idx, embedding in enumerate(embeddings) if embedding is None]
+        if missing:
+            new_embeddings = await super().generate_embeddings_batch(
+                [unique_texts[idx] for idx in missing]
+            )
+            for idx, embedding in zip(missing, new_embeddings):
+                embeddings[idx] = embedding
 
+            # Cache new embeddings, pipelined into one round trip
             try:
-                cached = await self.redis_client.get(cache_key)
-                if cached:
-                    embeddings.append((idx, json.loads(cached)))
-                else:
-                    texts_to_generate.append(text)
-                    text_indices.append(idx)
+                pipe = self.redis_client.pipeline(transaction=False)
+                for idx in missing:
+                    pipe.setex(cache_keys[idx], self.cache_ttl, _pack_embedding(embeddings[idx], self._binary_cache))
+                await pipe.execute()
             except Exception:
-                texts_to_generate.append(text)
-                text_indices.append(idx)
+                # Cache write failure is non-critical
+                pass
 
-        # Generate missing embeddings
-        if texts_to_generate:
-            new_embeddings = await super().generate_embeddings_batch(texts_to_generate)
-
-            # Cache new embeddings and add to results
-            for text, embedding, idx in zip(texts_to_generate, new_embeddings, text_indices):
-                embeddings.append((idx, embedding))
-
-                # Cache it
-                try:
-                    text_hash = hashlib.sha256(text.encode()).hexdigest()
-                    cache_key = f"embedding:{self.provider}:{self.model}:{text_hash}"
-                    await self.redis_client.setex(
-                        cache_key,
-                        self.cache_ttl,
-                        json.dumps(embedding)
-                    )
-                except Exception:
-                    pass
+        if len(unique_texts) < len(texts):
+            embeddings_by_text = dict(zip(unique_texts, embeddings))
+            return [embeddings_by_text[text] for text in texts]
 
-        # Sort by original index and extract embeddings
-        embeddings.sort(key=lambda x: x[0])
-        return [emb for _, emb in embeddings]
+        return embeddings
 
 
 def get_default_embedding_service() -> EmbeddingService:
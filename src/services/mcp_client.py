@@ -4,21 +4,46 @@ This service manages connections to MCP servers and handles tool execution.
 """
 
 import asyncio
+import itertools
 import json
 import logging
+import re
 import subprocess
 import time
 import uuid
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import select
+import orjson
+from sqlalchemy import and_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.config import settings
+from src.core.metrics import mcp_request_queue_waits_total
 from src.db.models import MCPServer, MCPServerConfig, MCPToolExecution
 
 logger = logging.getLogger(__name__)
 
+# Longest JSON-RPC line accepted from a server's stdout; large tool results
+# (file contents, query rows) arrive as a single line
+_STDOUT_LINE_LIMIT = 16 * 1024 * 1024
+
+# A run of digits too long for a 64-bit integer. orjson would read such an integer
+# as a float, so lines containing one are parsed with json instead
+_WIDE_NUMBER_RE = re.compile(rb"\d{20,}")
+
+# Start of an oversized tool output kept in the execution log
+_TOOL_OUTPUT_PREVIEW_BYTES = 4096
+
+# Seconds between background pings of a running server
+_HEALTH_CHECK_INTERVAL = 30.0
+
+# How long a tenant's server config is reused before it is read again
+_CONFIG_CACHE_TTL = 30.0
+
 
 class MCPClientError(Exception):
     """Base exception for MCP client errors."""
@@ -38,9 +63,107 @@ class MCPToolExecutionError(MCPClientError):
     pass
 
 
+class _ResponseLinesProtocol(asyncio.subprocess.SubprocessStreamProtocol):
+    """Subprocess protocol that hands each complete stdout line to a callback.
+
+    Lines are sliced straight out of the chunks read from the pipe, so responses
+    skip the StreamReader buffer and the wake-up of a reader task. Only a line
+    split across chunks is buffered. stdin and stderr behave as usual.
+    """
+
+    def __init__(
+        self,
+        on_line: Callable[[bytes | bytearray | memoryview], None],
+        on_stdout_closed: Callable[[], None],
+        limit: int,
+        loop: asyncio.AbstractEventLoop,
+    ):
+        super().__init__(limit=limit, loop=loop)
+        self._on_line = on_line
+        self._on_stdout_closed = on_stdout_closed
+        self._line_limit = limit
+        self._partial = bytearray()
+        # Set while skipping the rest of a line that exceeded the limit
+        self._discarding = False
+
+    def pipe_data_received(self, fd: int, data: bytes) -> None:
+        if fd != 1:
+            super().pipe_data_received(fd, data)
+            return
+
+        view = memoryview(data)
+        start = 0
+        end = data.find(b"\n")
+
+        # Finish a line carried over from earlier chunks
+        if end != -1 and (self._partial or self._discarding):
+            if not self._discarding:
+                self._partial += view[: end + 1]
+                self._on_line(self._partial)
+            self._partial.clear()
+            self._discarding = False
+            start = end + 1
+            end = data.find(b"\n", start)
+
+        while end != -1:
+            self._on_line(view[start : end + 1])
+            start = end + 1
+            end = data.find(b"\n", start)
+
+        if start < len(data) and not self._discarding:
+            self._partial += view[start:]
+            if len(self._partial) > self._line_limit:
+                logger.error(f"MCP server response exceeds {self._line_limit} bytes, dropping it")
+                self._partial.clear()
+                self._discarding = True
+
+    def pipe_connection_lost(self, fd: int, exc: Exception | None) -> None:
+        if fd == 1:
+            if self._partial:
+                # Server closed stdout after an unterminated last line
+                self._on_line(self._partial)
+                self._partial.clear()
+            # No more responses can arrive
+            self._on_stdout_closed()
+        super().pipe_connection_lost(fd, exc)
+
+
+def _loads_response(line: bytes | bytearray | memoryview) -> Any:
+    """Parse a JSON-RPC line, falling back to json for what orjson can't read exactly.
+
+    orjson turns integers wider than 64 bits into floats and rejects NaN, Infinity
+    and numbers that overflow a double, all of which json reads as before.
+    """
+    if _WIDE_NUMBER_RE.search(line) is None:
+        try:
+            return orjson.loads(line)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(bytes(line))
+
+
 class MCPServerProcess:
     """Manages a single MCP server process with stdio communication."""
 
+    __slots__ = (
+        "server_id",
+        "command",
+        "args",
+        "env",
+        "timeout",
+        "process",
+        "pending_requests",
+        "_next_id",
+        "_request_slots",
+        "_deadlines",
+        "_deadline_added",
+        "_timeout_task",
+        "_healthy",
+        "_health_task",
+        "_tools",
+        "_resources",
+    )
+
     def __init__(
         self,
         server_id: uuid.UUID,
@@ -48,6 +171,7 @@ class MCPServerProcess:
         args: list[str] | None = None,
         env: dict[str, str] | None = None,
         timeout: int = 30,
+        max_concurrent_requests: int = 8,
     ):
         self.server_id = server_id
         self.command = command
@@ -55,9 +179,18 @@ class MCPServerProcess:
         self.env = env or {}
         self.timeout = timeout
         self.process: asyncio.subprocess.Process | None = None
-        self.request_id = 0
+        self._next_id = itertools.count(1)
+        # Bounds requests in flight; servers often handle them one at a time anyway
+        self._request_slots = asyncio.Semaphore(max_concurrent_requests)
         self.pending_requests: dict[int, asyncio.Future] = {}
-        self._reader_task: asyncio.Task | None = None
+        # (deadline, request_id) in send order; every request shares self.timeout,
+        # so deadlines are already sorted and one task can expire them all
+        self._deadlines: deque[tuple[float, int]] = deque()
+        self._deadline_added = asyncio.Event()
+        self._timeout_task: asyncio.Task | None = None
+        # Result of the last background ping, so callers needn't ping per request
+        self._healthy = False
+        self._health_task: asyncio.Task | None = None
         self._tools: list[dict[str, Any]] = []
         self._resources: list[dict[str, Any]] = []
 
@@ -69,21 +202,32 @@ class MCPServerProcess:
 
             logger.info(f"Starting MCP server {self.server_id}: {' '.join(cmd)}")
 
-            # Start process with stdio pipes
-            self.process = await asyncio.create_subprocess_exec(
+            # Start process with stdio pipes; responses are dispatched as they arrive
+            loop = asyncio.get_running_loop()
+            transport, protocol = await loop.subprocess_exec(
+                lambda: _ResponseLinesProtocol(
+                    self._handle_response,
+                    lambda: self._fail_pending("Server closed its output"),
+                    _STDOUT_LINE_LIMIT,
+                    loop,
+                ),
                 *cmd,
                 stdin=asyncio.subprocess.PIPE,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
                 env=self.env,
             )
+            self.process = asyncio.subprocess.Process(transport, protocol, loop)
 
-            # Start reading responses
-            self._reader_task = asyncio.create_task(self._read_responses())
+            # Start expiring timed-out requests
+            self._timeout_task = asyncio.create_task(self._expire_requests())
 
             # Initialize connection and discover tools
             await self._initialize()
 
+            self._healthy = True
+            self._health_task = asyncio.create_task(self._monitor_health())
+
             logger.info(f"MCP server {self.server_id} started successfully")
 
         except Exception as e:
@@ -94,14 +238,16 @@ class MCPServerProcess:
     async def stop(self) -> None:
         """Stop the MCP server process."""
         try:
-            if self._reader_task:
-                self._reader_task.cancel()
-                try:
-                    await self._reader_task
-                except asyncio.CancelledError:
-                    pass
-
-            if self.process:
+            self._healthy = False
+            for task in (self._timeout_task, self._health_task):
+                if task:
+                    task.cancel()
+                    try:
+                        await task
+                    except asyncio.CancelledError:
+                        pass
+
+            if self.process and self.process.returncode is None:
                 try:
                     self.process.terminate()
                     await asyncio.wait_for(self.process.wait(), timeout=5.0)
@@ -110,82 +256,100 @@ class MCPServerProcess:
                     await self.process.wait()
 
             self.process = None
-            self.pending_requests.clear()
+            self._fail_pending("Server stopped")
+            self._deadlines.clear()
 
             logger.info(f"MCP server {self.server_id} stopped")
 
         except Exception as e:
             logger.error(f"Error stopping MCP server {self.server_id}: {e}")
 
-    async def _send_request(self, method: str, params: dict[str, Any] | None = None) -> Any:
-        """Send JSON-RPC request to MCP server."""
-        if not self.process or not self.process.stdin:
-            raise MCPServerConnectionError("Server process not running")
+    def _fail_pending(self, reason: str) -> None:
+        """Fail every request still waiting for a response."""
+        pending, self.pending_requests = self.pending_requests, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(MCPServerConnectionError(reason))
 
-        self.request_id += 1
-        request_id = self.request_id
+    async def _send_request(self, method: str, params: dict[str, Any] | None = None) -> Any:
+        """Send JSON-RPC request to MCP server, waiting for a free request slot first."""
+        if self._request_slots.locked():
+            mcp_request_queue_waits_total.labels(server_id=str(self.server_id)).inc()
 
-        request = {"jsonrpc": "2.0", "id": request_id, "method": method, "params": params or {}}
+        async with self._request_slots:
+            if not self.process or not self.process.stdin:
+                raise MCPServerConnectionError("Server process not running")
 
-        # Create future for response
-        future: asyncio.Future = asyncio.Future()
-        self.pending_requests[request_id] = future
+            request_id = next(self._next_id)
 
-        try:
-            # Send request
-            request_json = json.dumps(request) + "\n"
-            self.process.stdin.write(request_json.encode())
-            await self.process.stdin.drain()
+            request = {"jsonrpc": "2.0", "id": request_id, "method": method, "params": params or {}}
 
-            # Wait for response with timeout
-            result = await asyncio.wait_for(future, timeout=self.timeout)
-            return result
+            # Create future for response; _expire_requests fails it after the timeout
+            loop = asyncio.get_running_loop()
+            future: asyncio.Future = loop.create_future()
+            self.pending_requests[request_id] = future
+            self._deadlines.append((loop.time() + self.timeout, request_id))
+            self._deadline_added.set()
 
-        except asyncio.TimeoutError:
-            self.pending_requests.pop(request_id, None)
-            raise MCPToolExecutionError(f"Request timeout after {self.timeout}s")
-        except Exception as e:
-            self.pending_requests.pop(request_id, None)
-            raise MCPToolExecutionError(f"Request failed: {e}")
+            try:
+                # Send request as one newline-terminated JSON line
+                self.process.stdin.write(orjson.dumps(request, option=orjson.OPT_APPEND_NEWLINE))
+                await self.process.stdin.drain()
 
-    async def _read_responses(self) -> None:
-        """Read and process responses from MCP server."""
-        if not self.process or not self.process.stdout:
-            return
+                # Wait for response
+                return await future
 
+            except asyncio.TimeoutError:
+                # _expire_requests has already removed the request
+                raise MCPToolExecutionError(f"Request timeout after {self.timeout}s")
+            except Exception as e:
+                self.pending_requests.pop(request_id, None)
+                raise MCPToolExecutionError(f"Request failed: {e}")
+
+    async def _expire_requests(self) -> None:
+        """Fail requests still pending at their deadline with a timeout."""
+        loop = asyncio.get_running_loop()
+        while True:
+            if not self._deadlines:
+                self._deadline_added.clear()
+                await self._deadline_added.wait()
+                continue
+
+            deadline, request_id = self._deadlines[0]
+            delay = deadline - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+
+            self._deadlines.popleft()
+            future = self.pending_requests.pop(request_id, None)
+            if future and not future.done():
+                future.set_exception(asyncio.TimeoutError())
+
+    def _handle_response(self, line: bytes | bytearray | memoryview) -> None:
+        """Resolve the pending request a response line answers."""
         try:
-            while True:
-                line = await self.process.stdout.readline()
-                if not line:
-                    break
-
-                try:
-                    response = json.loads(line.decode().strip())
-
-                    # Handle JSON-RPC response
-                    if "id" in response:
-                        request_id = response["id"]
-                        future = self.pending_requests.pop(request_id, None)
-                        if future and not future.done():
-                            if "error" in response:
-                                error = response["error"]
-                                future.set_exception(
-                                    MCPToolExecutionError(
-                                        f"{error.get('message', 'Unknown error')} (code: {error.get('code')})"
-                                    )
-                                )
-                            else:
-                                future.set_result(response.get("result"))
-
-                except json.JSONDecodeError as e:
-                    logger.error(f"Invalid JSON from MCP server: {e}")
-                except Exception as e:
-                    logger.error(f"Error processing response: {e}")
-
-        except asyncio.CancelledError:
-            pass
+            response = _loads_response(line)
+
+            # Handle JSON-RPC response
+            if "id" in response:
+                request_id = response["id"]
+                future = self.pending_requests.pop(request_id, None)
+                if future and not future.done():
+                    if "error" in response:
+                        error = response["error"]
+                        future.set_exception(
+                            MCPToolExecutionError(
+                                f"{error.get('message', 'Unknown error')} (code: {error.get('code')})"
+                            )
+                        )
+                    else:
+                        future.set_result(response.get("result"))
+
+        except json.JSONDecodeError as e:
+            logger.error(f"Invalid JSON from MCP server: {e}")
         except Exception as e:
-            logger.error(f"Error reading responses: {e}")
+            logger.error(f"Error processing response: {e}")
 
     async def _initialize(self) -> None:
         """Initialize connection and discover tools."""
@@ -202,18 +366,23 @@ class MCPServerProcess:
 
             logger.info(f"MCP server initialized: {result}")
 
-            # Discover tools
-            tools_result = await self._send_request("tools/list", {})
+            # Discover tools and resources, with both requests in flight at once
+            tools_result, resources_result = await asyncio.gather(
+                self._send_request("tools/list", {}),
+                self._send_request("resources/list", {}),
+                return_exceptions=True,
+            )
+
+            if isinstance(tools_result, BaseException):
+                raise tools_result
             self._tools = tools_result.get("tools", [])
             logger.info(f"Discovered {len(self._tools)} tools")
 
-            # Discover resources
-            try:
-                resources_result = await self._send_request("resources/list", {})
+            if isinstance(resources_result, BaseException):
+                logger.warning(f"Failed to discover resources: {resources_result}")
+            else:
                 self._resources = resources_result.get("resources", [])
                 logger.info(f"Discovered {len(self._resources)} resources")
-            except Exception as e:
-                logger.warning(f"Failed to discover resources: {e}")
 
         except Exception as e:
             raise MCPServerConnectionError(f"Failed to initialize: {e}")
@@ -239,6 +408,17 @@ class MCPServerProcess:
         """Get list of available resources."""
         return self._resources
 
+    @property
+    def is_alive(self) -> bool:
+        """Whether the process is running and answered its last background ping."""
+        return self._healthy and self.process is not None and self.process.returncode is None
+
+    async def _monitor_health(self) -> None:
+        """Ping the server periodically and record whether it answered."""
+        while True:
+            await asyncio.sleep(_HEALTH_CHECK_INTERVAL)
+            self._healthy = await self.health_check()
+
     async def health_check(self) -> bool:
         """Check if server is healthy."""
         try:
@@ -253,6 +433,105 @@ class MCPServerProcess:
             return False
 
 
+def _loggable_output(tool_output: Any) -> Any:
+    """Return a tool output as it should be stored in the execution log.
+
+    Outputs over MCP_TOOL_OUTPUT_LOG_MAX_BYTES of JSON are replaced by their size
+    and a preview, so large payloads don't bloat the log row. The caller still
+    receives the full output.
+    """
+    if tool_output is None:
+        return None
+
+    encoded = orjson.dumps(tool_output)
+    if len(encoded) <= settings.MCP_TOOL_OUTPUT_LOG_MAX_BYTES:
+        return tool_output
+
+    return {
+        "truncated": True,
+        "size_bytes": len(encoded),
+        "preview": encoded[:_TOOL_OUTPUT_PREVIEW_BYTES].decode("utf-8", errors="ignore"),
+    }
+
+
+@dataclass(slots=True)
+class _CachedConfig:
+    """The tool lists of a tenant's server config, as sets for per-call checks.
+
+    Both are empty when the tenant has no enabled config.
+    """
+
+    allowed_tools: frozenset[str]  # Empty means every tool is allowed
+    denied_tools: frozenset[str]
+    expires_at: float
+
+
+class _MCPProcessPool:
+    """Server processes shared by every MCPClient in this worker.
+
+    Processes are keyed by (tenant_id, server_id) and reference counted: each
+    client connected to a server holds one reference, and the process is stopped
+    once the last one is released.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[tuple[uuid.UUID, uuid.UUID], tuple[MCPServerProcess, int]] = {}
+        self._locks: dict[tuple[uuid.UUID, uuid.UUID], asyncio.Lock] = {}
+
+    async def acquire(
+        self,
+        key: tuple[uuid.UUID, uuid.UUID],
+        factory: Callable[[], Awaitable[MCPServerProcess]],
+    ) -> MCPServerProcess:
+        """Take a reference to the running process for key, starting one if needed."""
+        async with self._locks.setdefault(key, asyncio.Lock()):
+            entry = self._entries.get(key)
+            if entry:
+                process, refcount = entry
+                if process.is_alive:
+                    self._entries[key] = (process, refcount + 1)
+                    logger.debug(f"Reusing MCP server {key[1]} (refcount {refcount + 1})")
+                    return process
+
+                # The process exited or stopped answering while pooled; replace it
+                del self._entries[key]
+                await process.stop()
+
+            process = await factory()
+            self._entries[key] = (process, 1)
+            return process
+
+    async def release(self, key: tuple[uuid.UUID, uuid.UUID], process: MCPServerProcess) -> bool:
+        """Drop a reference to process, stopping it if it was the last one.
+
+        Returns:
+            True if the process was stopped
+        """
+        entry = self._entries.get(key)
+        if not entry or entry[0] is not process:
+            # Already discarded and stopped
+            return False
+
+        refcount = entry[1] - 1
+        if refcount > 0:
+            self._entries[key] = (process, refcount)
+            return False
+
+        del self._entries[key]
+        await process.stop()
+        return True
+
+    async def discard(self, key: tuple[uuid.UUID, uuid.UUID], process: MCPServerProcess) -> None:
+        """Stop an unhealthy process and remove it for every client sharing it."""
+        entry = self._entries.get(key)
+        if entry and entry[0] is process:
+            del self._entries[key]
+        await process.stop()
+
+
+_process_pool = _MCPProcessPool()
+
+
 class MCPClient:
     """MCP Client for managing multiple MCP servers and executing tools."""
 
@@ -260,62 +539,93 @@ class MCPClient:
         self.db = db
         self.tenant_id = tenant_id
         self.servers: dict[uuid.UUID, MCPServerProcess] = {}
+        self._config_cache: dict[uuid.UUID, _CachedConfig] = {}
+
+    async def _get_config(self, server_id: uuid.UUID) -> _CachedConfig:
+        """Get the tenant's enabled config for a server, cached for a short TTL."""
+        cached = self._config_cache.get(server_id)
+        if cached and cached.expires_at > time.monotonic():
+            return cached
+
+        result = await self.db.execute(
+            select(MCPServerConfig).where(
+                MCPServerConfig.server_id == server_id,
+                MCPServerConfig.tenant_id == self.tenant_id,
+                MCPServerConfig.enabled == True,  # noqa: E712
+            )
+        )
+        return self._cache_config(server_id, result.scalar_one_or_none())
+
+    def _cache_config(self, server_id: uuid.UUID, config: MCPServerConfig | None) -> _CachedConfig:
+        cached = _CachedConfig(
+            allowed_tools=frozenset(config.allowed_tools or ()) if config else frozenset(),
+            denied_tools=frozenset(config.denied_tools or ()) if config else frozenset(),
+            expires_at=time.monotonic() + _CONFIG_CACHE_TTL,
+        )
+        self._config_cache[server_id] = cached
+        return cached
 
     async def connect_server(self, server_id: uuid.UUID) -> MCPServerProcess:
         """Connect to an MCP server."""
         # Check if already connected
         if server_id in self.servers:
             process = self.servers[server_id]
-            if await process.health_check():
+            if process.is_alive:
                 return process
             else:
                 # Server is unhealthy, reconnect
-                await process.stop()
+                await _process_pool.discard((self.tenant_id, server_id), process)
                 del self.servers[server_id]
 
-        # Get server configuration from database
+        # Get server and this tenant's config (if exists) in one query
         result = await self.db.execute(
-            select(MCPServer).where(
+            select(MCPServer, MCPServerConfig)
+            .outerjoin(
+                MCPServerConfig,
+                and_(
+                    MCPServerConfig.server_id == MCPServer.id,
+                    MCPServerConfig.tenant_id == self.tenant_id,
+                    MCPServerConfig.enabled == True,  # noqa: E712
+                ),
+            )
+            .where(
                 MCPServer.id == server_id,
                 MCPServer.tenant_id == self.tenant_id,
                 MCPServer.deleted_at.is_(None),
             )
         )
-        server = result.scalar_one_or_none()
+        row = result.one_or_none()
 
-        if not server:
+        if not row:
             raise MCPServerConnectionError(f"Server {server_id} not found")
 
+        server, config = row
+        self._cache_config(server_id, config)
+
         if server.status not in ["active", "ready", "running"]:
             raise MCPServerConnectionError(f"Server {server_id} is not active (status: {server.status})")
 
         if not server.command:
             raise MCPServerConnectionError(f"Server {server_id} has no command configured")
 
-        # Get server config for this tenant (if exists)
-        config_result = await self.db.execute(
-            select(MCPServerConfig).where(
-                MCPServerConfig.server_id == server_id,
-                MCPServerConfig.tenant_id == self.tenant_id,
-                MCPServerConfig.enabled == True,  # noqa: E712
+        async def start_process() -> MCPServerProcess:
+            # Only reached when no running process can be shared, so the
+            # environment is built once per spawn rather than per connect
+            env = {**(server.env_vars or {}), **((config and config.env_overrides) or {})}
+
+            process = MCPServerProcess(
+                server_id=server_id,
+                command=server.command,
+                args=server.args,
+                env=env,
+                timeout=config.timeout_seconds if config else 30,
+                max_concurrent_requests=config.max_concurrent_requests if config else 8,
             )
-        )
-        config = config_result.scalar_one_or_none()
+            await process.start()
+            return process
 
-        # Build environment variables
-        env = dict(server.env_vars) if server.env_vars else {}
-        if config and config.env_overrides:
-            env.update(config.env_overrides)
-
-        # Get timeout
-        timeout = config.timeout_seconds if config else 30
-
-        # Create and start server process
-        process = MCPServerProcess(
-            server_id=server_id, command=server.command, args=server.args, env=env, timeout=timeout
-        )
-
-        await process.start()
+        # Share a running process with other clients of this tenant, or start one
+        process = await _process_pool.acquire((self.tenant_id, server_id), start_process)
 
         # Update server status
         server.status = "running"
@@ -328,19 +638,21 @@ class MCPClient:
 
     async def disconnect_server(self, server_id: uuid.UUID) -> None:
         """Disconnect from an MCP server."""
+        self._config_cache.pop(server_id, None)
+
         if server_id in self.servers:
-            process = self.servers[server_id]
-            await process.stop()
-            del self.servers[server_id]
+            process = self.servers.pop(server_id)
+            if not await _process_pool.release((self.tenant_id, server_id), process):
+                # Still in use by another client
+                return
 
             # Update server status
-            result = await self.db.execute(
-                select(MCPServer).where(MCPServer.id == server_id, MCPServer.tenant_id == self.tenant_id)
+            await self.db.execute(
+                update(MCPServer)
+                .where(MCPServer.id == server_id, MCPServer.tenant_id == self.tenant_id)
+                .values(status="stopped")
             )
-            server = result.scalar_one_or_none()
-            if server:
-                server.status = "stopped"
-                await self.db.commit()
+            await self.db.commit()
 
     async def execute_tool(
         self,
@@ -355,7 +667,7 @@ class MCPClient:
         start_time = time.time()
         execution_id = uuid.uuid4()
 
-        # Create execution log
+        # Create execution log; it is written with the outcome in one transaction
         execution = MCPToolExecution(
             id=execution_id,
             tenant_id=self.tenant_id,
@@ -365,34 +677,23 @@ class MCPClient:
             agent_id=agent_id,
             tool_name=tool_name,
             tool_input=tool_input,
-            status="running",
             started_at=datetime.utcnow(),
         )
-        self.db.add(execution)
-        await self.db.commit()
 
         try:
             # Connect to server if not already connected
             process = await self.connect_server(server_id)
 
             # Check if tool is allowed
-            config_result = await self.db.execute(
-                select(MCPServerConfig).where(
-                    MCPServerConfig.server_id == server_id,
-                    MCPServerConfig.tenant_id == self.tenant_id,
-                    MCPServerConfig.enabled == True,  # noqa: E712
-                )
-            )
-            config = config_result.scalar_one_or_none()
+            config = await self._get_config(server_id)
 
-            if config:
-                # Check denied tools
-                if config.denied_tools and tool_name in config.denied_tools:
-                    raise MCPToolExecutionError(f"Tool {tool_name} is denied")
+            # Check denied tools
+            if tool_name in config.denied_tools:
+                raise MCPToolExecutionError(f"Tool {tool_name} is denied")
 
-                # Check allowed tools
-                if config.allowed_tools and tool_name not in config.allowed_tools:
-                    raise MCPToolExecutionError(f"Tool {tool_name} is not in allowed list")
+            # Check allowed tools
+            if config.allowed_tools and tool_name not in config.allowed_tools:
+                raise MCPToolExecutionError(f"Tool {tool_name} is not in allowed list")
 
             # Execute tool
             tool_output = await process.execute_tool(tool_name, tool_input)
@@ -402,18 +703,13 @@ class MCPClient:
 
             # Update execution log
             execution.status = "success"
-            execution.tool_output = tool_output
+            execution.tool_output = _loggable_output(tool_output)
             execution.execution_time_ms = execution_time_ms
             execution.completed_at = datetime.utcnow()
+            self.db.add(execution)
 
             # Update server statistics
-            result = await self.db.execute(
-                select(MCPServer).where(MCPServer.id == server_id, MCPServer.tenant_id == self.tenant_id)
-            )
-            server = result.scalar_one_or_none()
-            if server:
-                server.total_executions += 1
-                server.successful_executions += 1
+            await self._count_execution(server_id, succeeded=True)
 
             await self.db.commit()
 
@@ -433,20 +729,28 @@ class MCPClient:
             execution.error_message = str(e)
             execution.execution_time_ms = execution_time_ms
             execution.completed_at = datetime.utcnow()
+            self.db.add(execution)
 
             # Update server statistics
-            result = await self.db.execute(
-                select(MCPServer).where(MCPServer.id == server_id, MCPServer.tenant_id == self.tenant_id)
-            )
-            server = result.scalar_one_or_none()
-            if server:
-                server.total_executions += 1
-                server.failed_executions += 1
+            await self._count_execution(server_id, succeeded=False)
 
             await self.db.commit()
 
             raise
 
+    async def _count_execution(self, server_id: uuid.UUID, succeeded: bool) -> None:
+        """Increment a server's execution counters in a single UPDATE.
+
+        The increments happen in the database, so concurrent tool calls can't
+        overwrite each other's counts.
+        """
+        outcome = MCPServer.successful_executions if succeeded else MCPServer.failed_executions
+        await self.db.execute(
+            update(MCPServer)
+            .where(MCPServer.id == server_id, MCPServer.tenant_id == self.tenant_id)
+            .values({MCPServer.total_executions: MCPServer.total_executions + 1, outcome: outcome + 1})
+        )
+
     async def discover_tools(self, server_id: uuid.UUID) -> list[dict[str, Any]]:
         """Discover available tools from an MCP server."""
         process = await self.connect_server(server_id)
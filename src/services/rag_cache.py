@@ -0,0 +1,168 @@
+"""Semantic cache for RAG retrieval results.
+
+Queries whose embeddings are nearly identical to a recently answered query (same
+tenant, collection, top_k and threshold) reuse that query's ranked chunk IDs
+instead of running another vector search.
+"""
+
+import itertools
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Sequence
+
+import numpy as np
+
+from src.core.config import settings
+
+# (tenant_id, collection_id, top_k, similarity_threshold)
+CacheScope = tuple[uuid.UUID, uuid.UUID | None, int, float | None]
+
+
+@dataclass(slots=True)
+class _CacheEntry:
+    scope: CacheScope
+    vector: np.ndarray
+    chunk_ids: list[uuid.UUID]
+    expires_at: float
+
+
+class SemanticQueryCache:
+    """In-process LRU of retrieval results, looked up by query-embedding similarity.
+
+    Embeddings are L2-normalized on insert, so a lookup is one matrix-vector inner
+    product over the entries sharing the query's scope.
+    """
+
+    def __init__(
+        self, max_entries: int = 1024, ttl_seconds: float = 300.0, min_similarity: float = 0.95
+    ):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached queries (0 disables the cache)
+            ttl_seconds: How long a cached result stays valid
+            min_similarity: Cosine similarity a query needs to reuse a cached result
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.min_similarity = min_similarity
+
+        self._entries: OrderedDict[int, _CacheEntry] = OrderedDict()
+        self._entry_ids = itertools.count()
+        # Per scope, the entry ids and their vectors stacked into one matrix; rebuilt
+        # lazily after the scope's entries change
+        self._scopes: dict[CacheScope, list[int]] = {}
+        self._matrices: dict[CacheScope, np.ndarray] = {}
+
+    @staticmethod
+    def _normalize(embedding: Sequence[float]) -> np.ndarray | None:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        return vector / norm if norm > 0 else None
+
+    def get(self, scope: CacheScope, embedding: Sequence[float]) -> list[uuid.UUID] | None:
+        """Return the ranked chunk IDs of the closest cached query in scope, if any."""
+        entry_ids = self._scopes.get(scope)
+        if not entry_ids:
+            return None
+
+        vector = self._normalize(embedding)
+        if vector is None:
+            return None
+
+        matrix = self._matrices.get(scope)
+        if matrix is None:
+            matrix = np.stack([self._entries[entry_id].vector for entry_id in entry_ids])
+            self._matrices[scope] = matrix
+
+        similarities = matrix @ vector
+        best = int(np.argmax(similarities))
+        if similarities[best] < self.min_similarity:
+            return None
+
+        entry_id = entry_ids[best]
+        entry = self._entries[entry_id]
+        if entry.expires_at < time.monotonic():
+            self._remove(entry_id)
+            return None
+
+        self._entries.move_to_end(entry_id)
+        return entry.chunk_ids
+
+    def put(
+        self, scope: CacheScope, embedding: Sequence[float], chunk_ids: list[uuid.UUID]
+    ) -> None:
+        """Cache the ranked chunk IDs retrieved for a query embedding."""
+        if self.max_entries <= 0:
+            return
+
+        vector = self._normalize(embedding)
+        if vector is None:
+            return
+
+        entry_id = next(self._entry_ids)
+        self._entries[entry_id] = _CacheEntry(
+            scope=scope,
+            vector=vector,
+            chunk_ids=chunk_ids,
+            expires_at=time.monotonic() + self.ttl_seconds,
+        )
+        self._scopes.setdefault(scope, []).append(entry_id)
+        self._matrices.pop(scope, None)
+
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
+
+    def invalidate(self, tenant_id: uuid.UUID, collection_id: uuid.UUID | None = None) -> None:
+        """Drop cached results that may include chunks from a collection.
+
+        Tenant-wide searches (no collection) span every collection, so they are
+        dropped too. Without a collection_id, all of the tenant's entries go.
+        """
+        stale = [
+            scope
+            for scope in self._scopes
+            if scope[0] == tenant_id
+            and (collection_id is None or scope[1] in (collection_id, None))
+        ]
+        for scope in stale:
+            for entry_id in self._scopes.pop(scope):
+                del self._entries[entry_id]
+            self._matrices.pop(scope, None)
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        self._entries.clear()
+        self._scopes.clear()
+        self._matrices.clear()
+
+    def _remove(self, entry_id: int) -> None:
+        entry = self._entries.pop(entry_id)
+        entry_ids = self._scopes[entry.scope]
+        entry_ids.remove(entry_id)
+        if not entry_ids:
+            del self._scopes[entry.scope]
+        self._matrices.pop(entry.scope, None)
+
+
+_query_cache: SemanticQueryCache | None = None
+
+
+def get_query_cache() -> SemanticQueryCache:
+    """Get the process-wide semantic query cache.
+
+    Returns:
+        SemanticQueryCache instance
+    """
+    global _query_cache
+
+    if _query_cache is None:
+        _query_cache = SemanticQueryCache(
+            max_entries=settings.RAG_QUERY_CACHE_SIZE,
+            ttl_seconds=settings.RAG_QUERY_CACHE_TTL,
+            min_similarity=settings.RAG_QUERY_CACHE_MIN_SIMILARITY,
+        )
+
+    return _query_cache
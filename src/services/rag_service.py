@@ -7,11 +7,12 @@ from typing import Any
 
 from sqlalchemy import select, func, and_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import defer, selectinload
 
 from src.db.models import Collection, Document, Chunk, RAGQuery
 from src.services.document_processor import DocumentProcessor
 from src.services.embedding_service import EmbeddingService, get_default_embedding_service
+from src.services.rag_cache import get_query_cache
 
 
 class RAGService:
@@ -200,6 +201,9 @@ class RAGService:
 
         await self.db.flush()
 
+        # Cached searches over this collection may now miss the new chunks
+        get_query_cache().invalidate(self.tenant_id, collection.id)
+
     async def query(
         self,
         query: str,
@@ -228,50 +232,57 @@ class RAGService:
         embedding_service = get_default_embedding_service()
         query_embedding = await embedding_service.generate_query_embedding(query)
 
-        # Build query
         # Vector similarity using cosine distance (1 - cosine_similarity)
-        # pgvector's <=> operator returns cosine distance
+        # pgvector's <=> operator returns cosine distance. It is selected next to each
+        # chunk, and the embedding column itself is deferred so result rows don't carry
+        # the full vectors back just to be scored again in Python.
         similarity_expr = Chunk.embedding.cosine_distance(query_embedding)
-
-        query_stmt = select(Chunk).where(
-            Chunk.tenant_id == self.tenant_id
+        base_stmt = (
+            select(Chunk, similarity_expr)
+            .options(defer(Chunk.embedding))
+            .where(Chunk.tenant_id == self.tenant_id)
         )
 
-        if collection_id:
-            query_stmt = query_stmt.where(Chunk.collection_id == collection_id)
+        # A near-identical query answered recently gives the ranked chunk IDs directly,
+        # so only a primary-key lookup is needed instead of a vector scan
+        query_cache = get_query_cache()
+        cache_scope = (self.tenant_id, collection_id, top_k, similarity_threshold)
+        cached_ids = None if metadata_filter else query_cache.get(cache_scope, query_embedding)
 
         # Add similarity threshold if provided
         if similarity_threshold is not None:
             # Convert threshold to distance (1 - threshold)
             max_distance = 1.0 - similarity_threshold
-            query_stmt = query_stmt.where(similarity_expr <= max_distance)
+            base_stmt = base_stmt.where(similarity_expr <= max_distance)
 
-        # Order by similarity and limit
-        query_stmt = query_stmt.order_by(similarity_expr).limit(top_k)
+        if cached_ids is not None:
+            # The cached IDs were ranked for a slightly different embedding, so the
+            # threshold and ordering are re-applied to this query's own distances
+            result = await self.db.execute(
+                base_stmt.where(Chunk.id.in_(cached_ids)).order_by(similarity_expr)
+            )
+            rows = result.all()
+        else:
+            query_stmt = base_stmt
 
-        # Execute query
-        result = await self.db.execute(query_stmt)
-        chunks = list(result.scalars().all())
+            if collection_id:
+                query_stmt = query_stmt.where(Chunk.collection_id == collection_id)
 
-        # Calculate similarity scores (1 - distance)
-        # Note: We'll add score as a runtime attribute
-        # The distance is already calculated in the SQL query via cosine_distance
-        # We need to compute it manually from the embeddings
-        import numpy as np
+            # Order by similarity and limit
+            query_stmt = query_stmt.order_by(similarity_expr).limit(top_k)
 
-        for chunk in chunks:
-            # Convert pgvector to numpy array if needed
-            chunk_vec = np.array(chunk.embedding) if not isinstance(chunk.embedding, np.ndarray) else chunk.embedding
-            query_vec = np.array(query_embedding) if not isinstance(query_embedding, np.ndarray) else query_embedding
+            # Execute query
+            result = await self.db.execute(query_stmt)
+            rows = result.all()
 
-            # Calculate cosine similarity manually
-            dot_product = np.dot(chunk_vec, query_vec)
-            norm_chunk = np.linalg.norm(chunk_vec)
-            norm_query = np.linalg.norm(query_vec)
+            if not metadata_filter:
+                query_cache.put(cache_scope, query_embedding, [chunk.id for chunk, _ in rows])
 
-            # Cosine similarity (ranges from -1 to 1, higher is more similar)
-            cosine_sim = dot_product / (norm_chunk * norm_query) if (norm_chunk > 0 and norm_query > 0) else 0.0
-            chunk.score = float(cosine_sim)  # type: ignore
+        # Similarity score (1 - distance) as a runtime attribute
+        chunks = []
+        for chunk, distance in rows:
+            chunk.score = 1.0 - float(distance)  # type: ignore
+            chunks.append(chunk)
 
         retrieval_time_ms = int((time.time() - start_time) * 1000)
 
@@ -472,4 +483,6 @@ class RAGService:
 
         collection.deleted_at = datetime.utcnow()
         await self.db.flush()
+
+        get_query_cache().invalidate(self.tenant_id, collection_id)
         return True
@@ -0,0 +1,46 @@
+"""
+MCP Client Tests
+
+Tests for the MCP client's handling of server responses.
+"""
+
+import asyncio
+import math
+import uuid
+
+import pytest
+
+from src.services.mcp_client import MCPServerProcess
+
+
+@pytest.mark.mcp
+@pytest.mark.unit
+class TestMCPServerProcessResponses:
+    """Test parsing of JSON-RPC response lines."""
+
+    @pytest.fixture
+    def server_process(self):
+        """Create a server process that is never started."""
+        return MCPServerProcess(server_id=uuid.uuid4(), command="unused")
+
+    @pytest.mark.asyncio
+    async def test_integer_wider_than_64_bits_arrives_intact(self, server_process):
+        """Test that a result integer beyond 64 bits is not turned into a float."""
+        future = asyncio.get_running_loop().create_future()
+        server_process.pending_requests[1] = future
+
+        server_process._handle_response(
+            b'{"jsonrpc": "2.0", "id": 1, "result": {"result": %d}}\n' % 2**100
+        )
+
+        assert future.result() == {"result": 2**100}
+
+    @pytest.mark.asyncio
+    async def test_non_finite_number_resolves_request(self, server_process):
+        """Test that NaN, which orjson rejects, still resolves the request."""
+        future = asyncio.get_running_loop().create_future()
+        server_process.pending_requests[1] = future
+
+        server_process._handle_response(b'{"jsonrpc": "2.0", "id": 1, "result": NaN}\n')
+
+        assert math.isnan(future.result())
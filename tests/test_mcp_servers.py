@@ -9,6 +9,7 @@ Tests for MCP server implementations including:
 """
 
 import asyncio
+import contextlib
 import json
 import os
 import tempfile
@@ -17,6 +18,7 @@ from pathlib import Path
 import pytest
 
 from src.mcp_servers.calculator_server import CalculatorMCPServer
+from src.mcp_servers.database_server import DatabaseMCPServer
 from src.mcp_servers.filesystem_server import FilesystemMCPServer
 
 
@@ -47,28 +49,28 @@ class TestCalculatorMCPServer:
         """Test add tool."""
         result = await calculator_server.handle_tool_call("add", {"a": 5, "b": 3})
 
-        assert result["result"] == 8
+        assert result["content"]["result"] == 8
 
     @pytest.mark.asyncio
     async def test_subtract_tool(self, calculator_server):
         """Test subtract tool."""
         result = await calculator_server.handle_tool_call("subtract", {"a": 10, "b": 4})
 
-        assert result["result"] == 6
+        assert result["content"]["result"] == 6
 
     @pytest.mark.asyncio
     async def test_multiply_tool(self, calculator_server):
         """Test multiply tool."""
         result = await calculator_server.handle_tool_call("multiply", {"a": 6, "b": 7})
 
-        assert result["result"] == 42
+        assert result["content"]["result"] == 42
 
     @pytest.mark.asyncio
     async def test_divide_tool(self, calculator_server):
         """Test divide tool."""
         result = await calculator_server.handle_tool_call("divide", {"a": 15, "b": 3})
 
-        assert result["result"] == 5.0
+        assert result["content"]["result"] == 5.0
 
     @pytest.mark.asyncio
     async def test_divide_by_zero(self, calculator_server):
@@ -81,7 +83,16 @@ class TestCalculatorMCPServer:
         """Test power tool."""
         result = await calculator_server.handle_tool_call("power", {"a": 2, "b": 8})
 
-        assert result["result"] == 256
+        assert result["content"]["result"] == 256
+
+    @pytest.mark.asyncio
+    async def test_power_result_beyond_64_bits_is_sent(self, calculator_server, capfdbinary):
+        """Test that integers too wide for orjson still serialize in the response."""
+        result = await calculator_server.handle_tool_call("power", {"base": 2, "exponent": 100})
+        await calculator_server.send_response(1, result)
+
+        response = json.loads(capfdbinary.readouterr().out)
+        assert response["result"]["content"]["result"] == 2**100
 
     @pytest.mark.asyncio
     async def test_unknown_tool(self, calculator_server):
@@ -138,6 +149,28 @@ class TestFilesystemMCPServer:
         )
         assert read_result["content"] == content
 
+    @pytest.mark.asyncio
+    async def test_chunked_read_keeps_multibyte_characters_whole(
+        self, filesystem_server, temp_dir
+    ):
+        """Test that chunked text reads never split a UTF-8 character."""
+        test_file = temp_dir / "test.txt"
+        content = "héllo wörld ✓"
+        test_file.write_text(content, encoding="utf-8")
+
+        chunks = []
+        offset = 0
+        while True:
+            result = await filesystem_server.handle_tool_call(
+                "read_file", {"path": str(test_file), "offset": offset, "length": 3}
+            )
+            chunks.append(result["content"])
+            offset += result["bytes_read"]
+            if result["eof"]:
+                break
+
+        assert "".join(chunks) == content
+
     @pytest.mark.asyncio
     async def test_list_directory(self, filesystem_server, temp_dir):
         """Test listing directory contents."""
@@ -211,6 +244,65 @@ class TestFilesystemMCPServer:
         file_names = [Path(f).name for f in result["files"]]
         assert "test1.txt" in file_names
 
+    @pytest.mark.asyncio
+    async def test_search_files_recursive_pattern(self, filesystem_server, temp_dir):
+        """Test recursive search, including a repeat after the tree changes."""
+        (temp_dir / "pkg" / "sub").mkdir(parents=True)
+        (temp_dir / "pkg" / "a.py").write_text("a")
+        (temp_dir / "pkg" / "sub" / "b.py").write_text("b")
+        (temp_dir / "pkg" / "notes.txt").write_text("c")
+
+        result = await filesystem_server.handle_tool_call(
+            "search_files", {"directory": str(temp_dir), "pattern": "**/*.py"}
+        )
+        assert sorted(m["name"] for m in result["matches"]) == ["a.py", "b.py"]
+
+        (temp_dir / "pkg" / "sub" / "c.py").write_text("c")
+        result = await filesystem_server.handle_tool_call(
+            "search_files", {"directory": str(temp_dir), "pattern": "pkg/sub/*.py"}
+        )
+        assert sorted(m["name"] for m in result["matches"]) == ["b.py", "c.py"]
+
+    @pytest.mark.asyncio
+    async def test_search_files_max_results(self, filesystem_server, temp_dir):
+        """Test that search stops at max_results and reports truncation."""
+        for i in range(5):
+            (temp_dir / f"f{i}.txt").write_text("x")
+
+        result = await filesystem_server.handle_tool_call(
+            "search_files", {"directory": str(temp_dir), "pattern": "*.txt", "max_results": 3}
+        )
+        assert result["count"] == 3
+        assert result["truncated"] is True
+
+        result = await filesystem_server.handle_tool_call(
+            "search_files", {"directory": str(temp_dir), "pattern": "*.txt"}
+        )
+        assert result["count"] == 5
+        assert result["truncated"] is False
+
+    @pytest.mark.asyncio
+    async def test_search_files_skips_symlinks_leaving_allowed_paths(
+        self, filesystem_server, temp_dir
+    ):
+        """Test that search drops matches reached through symlinks pointing outside."""
+        (temp_dir / "inside.txt").write_text("x")
+        (temp_dir / "alias.txt").symlink_to(temp_dir / "inside.txt")
+        with tempfile.TemporaryDirectory() as outside:
+            (Path(outside) / "secret.txt").write_text("x")
+            (temp_dir / "escape.txt").symlink_to(Path(outside) / "secret.txt")
+            (temp_dir / "escape_dir").symlink_to(outside)
+
+            result = await filesystem_server.handle_tool_call(
+                "search_files", {"directory": str(temp_dir), "pattern": "*/*.txt"}
+            )
+            assert result["matches"] == []
+
+            result = await filesystem_server.handle_tool_call(
+                "search_files", {"directory": str(temp_dir), "pattern": "*.txt"}
+            )
+            assert sorted(m["name"] for m in result["matches"]) == ["alias.txt", "inside.txt"]
+
     @pytest.mark.asyncio
     async def test_path_traversal_prevention(self, filesystem_server, temp_dir):
         """Test that path traversal attacks are prevented."""
@@ -226,6 +318,25 @@ class TestFilesystemMCPServer:
                 "read_file", {"path": str(temp_dir / ".." / ".." / "etc" / "passwd")}
             )
 
+    def test_symlink_swapped_in_after_validation_rejected(self, filesystem_server, temp_dir):
+        """Test that a file replaced by a symlink after validation is not followed."""
+        target = temp_dir / "swap.txt"
+        target.write_text("inside")
+        path = filesystem_server._validate_path(str(target))
+
+        target.unlink()
+        target.symlink_to("/etc/hostname")
+
+        with pytest.raises(ValueError, match="Symlinks are not allowed"):
+            filesystem_server._read_file_sync(path, False, 0, None)
+
+    def test_sibling_directory_with_shared_prefix_rejected(self, filesystem_server, temp_dir):
+        """Test that a sibling whose name extends the allowed dir is not allowed."""
+        with pytest.raises(ValueError, match="not within allowed"):
+            filesystem_server._validate_path(f"{temp_dir}-sibling/file.txt")
+
+        assert filesystem_server._validate_path(str(temp_dir)) == temp_dir.resolve()
+
     @pytest.mark.asyncio
     async def test_file_size_limit(self, filesystem_server, temp_dir):
         """Test that large files are rejected."""
@@ -248,6 +359,77 @@ class TestFilesystemMCPServer:
             )
 
 
+class _FakeCursor:
+    """Cursor over canned rows, recording how many were fetched."""
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    async def fetch(self, n):
+        return self.rows[:n]
+
+
+class _FakeConnection:
+    """Connection that records the SQL it is given and serves canned rows."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.statements = []
+
+    def transaction(self, readonly=False):
+        return contextlib.nullcontext()
+
+    async def cursor(self, sql, *params):
+        self.statements.append((sql, params))
+        return _FakeCursor(self.rows)
+
+
+class _FakePool:
+    def __init__(self, conn):
+        self.conn = conn
+
+    @contextlib.asynccontextmanager
+    async def acquire(self):
+        yield self.conn
+
+
+@pytest.mark.mcp
+@pytest.mark.unit
+class TestDatabaseMCPServerQuery:
+    """Test database server row capping."""
+
+    @pytest.fixture
+    def database_server(self):
+        """Create a database server with a small row cap and no real database."""
+        server = DatabaseMCPServer(database_url="postgresql://unused", max_rows=2)
+        server.pool = _FakePool(_FakeConnection([{"n": 1}, {"n": 2}, {"n": 3}]))
+        return server
+
+    @pytest.mark.asyncio
+    async def test_with_query_is_capped(self, database_server):
+        """Test that a WITH query is capped without its text being rewritten."""
+        database_server.read_only = False
+        sql = "WITH t AS (SELECT generate_series(1, 3) AS n) SELECT n FROM t"
+
+        result = await database_server.handle_tool_call("query", {"sql": sql})
+
+        assert database_server.pool.conn.statements == [(sql, ())]
+        assert result["rows"] == [{"n": 1}, {"n": 2}]
+        assert result["truncated"] is True
+
+    @pytest.mark.asyncio
+    async def test_trailing_comment_query_runs_as_written(self, database_server):
+        """Test that a query ending in a semicolon and comment is passed through."""
+        sql = "SELECT 1; -- note"
+        database_server.pool.conn.rows = [{"n": 1}]
+
+        result = await database_server.handle_tool_call("query", {"sql": sql})
+
+        assert database_server.pool.conn.statements == [(sql, ())]
+        assert result["rows"] == [{"n": 1}]
+        assert result["truncated"] is False
+
+
 @pytest.mark.mcp
 @pytest.mark.integration
 class TestMCPServerCommunication:
@@ -314,6 +496,33 @@ class TestMCPServerCommunication:
         assert "message" in error_response["error"]
 
 
+@pytest.mark.mcp
+@pytest.mark.unit
+class TestMCPMessageFraming:
+    """Test splitting of pipelined stdin messages."""
+
+    def test_newline_framing_splits_pipelined_messages(self):
+        """Test that several newline-delimited messages are parsed from one read."""
+        server = CalculatorMCPServer()
+        buffer = bytearray(b'{"id": 1}\n\n{"id": 2}\n{"id": 3')
+
+        messages = server._parse_messages(buffer)
+
+        assert [json.loads(m) for m in messages] == [{"id": 1}, {"id": 2}]
+        assert buffer == bytearray(b'{"id": 3')
+
+    def test_content_length_framing_waits_for_full_body(self):
+        """Test that content-length framing only yields complete bodies."""
+        server = CalculatorMCPServer()
+        server.framing = "content-length"
+        buffer = bytearray(b'Content-Length: 9\r\n\r\n{"id": 1}Content-Length: 9\r\n\r\n{"id"')
+
+        messages = server._parse_messages(buffer)
+
+        assert [json.loads(m) for m in messages] == [{"id": 1}]
+        assert buffer == bytearray(b'Content-Length: 9\r\n\r\n{"id"')
+
+
 @pytest.mark.mcp
 @pytest.mark.unit
 class TestMCPServerValidation:
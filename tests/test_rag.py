@@ -8,11 +8,15 @@ Tests for Retrieval-Augmented Generation including:
 - Collection management
 """
 
+import uuid
+
 import pytest
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.db.models import Collection, Document, Tenant, User
+from src.services.document_processor import DocumentProcessor
+from src.services.rag_cache import SemanticQueryCache
 
 
 @pytest.mark.rag
@@ -354,6 +358,59 @@ class TestDocumentChunking:
         # Verify overlap exists between consecutive chunks
         assert chunks[0].split()[-overlap:] == chunks[1].split()[:overlap]
 
+    def test_clean_text_collapses_whitespace(self):
+        """Test whitespace cleanup collapses every run, line breaks included."""
+        processor = DocumentProcessor()
+
+        text = "  Title \t here\r\n\n \n\nFirst  line\nsecond line  "
+
+        assert processor._clean_text(text) == "Title here First line second line"
+
+
+@pytest.mark.rag
+@pytest.mark.unit
+class TestSemanticQueryCache:
+    """Test the semantic query cache used in front of vector search."""
+
+    def test_similar_query_hits_and_distant_query_misses(self):
+        """Test lookups by embedding similarity within a scope."""
+        tenant_id, collection_id = uuid.uuid4(), uuid.uuid4()
+        scope = (tenant_id, collection_id, 5, None)
+        chunk_ids = [uuid.uuid4(), uuid.uuid4()]
+
+        cache = SemanticQueryCache(min_similarity=0.95)
+        cache.put(scope, [1.0, 0.0, 0.0], chunk_ids)
+
+        assert cache.get(scope, [0.99, 0.05, 0.0]) == chunk_ids
+        assert cache.get(scope, [0.0, 1.0, 0.0]) is None
+        assert cache.get((tenant_id, collection_id, 10, None), [1.0, 0.0, 0.0]) is None
+
+    def test_invalidate_collection_drops_collection_and_tenant_wide_entries(self):
+        """Test that invalidating a collection also drops tenant-wide searches."""
+        tenant_id, collection_id, other_id = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+        cache = SemanticQueryCache()
+        for scoped_collection in (collection_id, other_id, None):
+            cache.put((tenant_id, scoped_collection, 5, None), [1.0, 0.0], [uuid.uuid4()])
+
+        cache.invalidate(tenant_id, collection_id)
+
+        assert cache.get((tenant_id, collection_id, 5, None), [1.0, 0.0]) is None
+        assert cache.get((tenant_id, None, 5, None), [1.0, 0.0]) is None
+        assert cache.get((tenant_id, other_id, 5, None), [1.0, 0.0]) is not None
+
+    def test_evicts_least_recently_used(self):
+        """Test that the cache stays within max_entries."""
+        tenant_id = uuid.uuid4()
+        scope = (tenant_id, None, 5, None)
+        cache = SemanticQueryCache(max_entries=2)
+        cache.put(scope, [1.0, 0.0, 0.0], [uuid.uuid4()])
+        cache.put(scope, [0.0, 1.0, 0.0], [uuid.uuid4()])
+        cache.get(scope, [1.0, 0.0, 0.0])
+        cache.put(scope, [0.0, 0.0, 1.0], [uuid.uuid4()])
+
+        assert cache.get(scope, [1.0, 0.0, 0.0]) is not None
+        assert cache.get(scope, [0.0, 1.0, 0.0]) is None
+
 
 @pytest.mark.rag
 @pytest.mark.integration